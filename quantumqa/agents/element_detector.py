@@ -5,6 +5,7 @@ Uses AI vision models to identify and locate UI elements in screenshots.
 """
 
 import asyncio
+import json
 import time
 from pathlib import Path
 from typing import Dict, Any, Optional, List
@@ -12,6 +13,7 @@ from datetime import datetime, timedelta
 from cachetools import TTLCache
 
 from .base_agent import BaseAgent
+from ..utils.hashing import bytes_digest, file_digest, text_digest
 from ..core.llm import VisionLLMClient
 from ..core.models import (
     ElementDetectionResult, 
@@ -30,16 +32,34 @@ class ElementDetectorAgent(BaseAgent):
         agent_id: str = "element_detector",
         vision_client: Optional[VisionLLMClient] = None,
         cache_size: int = 1000,
-        cache_ttl: int = 3600  # 1 hour
+        cache_ttl: int = 3600,  # 1 hour
+        debug: bool = False,
+        cache_file: Optional[Path] = None,
+        persistent_cache_ttl: int = 7 * 24 * 3600  # 1 week
     ):
-        """Initialize the Element Detector Agent."""
+        """
+        Initialize the Element Detector Agent.
+        
+        Args:
+            cache_file: Optional JSON file used to persist high-confidence
+                detections across runs (keyed by screenshot content hash)
+            persistent_cache_ttl: Maximum age in seconds of persisted entries
+        """
         super().__init__(agent_id, "ElementDetector")
         
         self.vision_client = vision_client
+        self.debug = debug
         
         # Element detection cache
         self.cache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
         
+        # Persistent detection cache (cache_key -> {"saved_at", "result"})
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.cache_size = cache_size
+        self.persistent_cache_ttl = persistent_cache_ttl
+        self._persistent_cache: Dict[str, Dict[str, Any]] = {}
+        self._persistent_cache_dirty = False
+        
         # Detection statistics
         self.total_detections = 0
         self.successful_detections = 0
@@ -65,6 +85,9 @@ class ElementDetectorAgent(BaseAgent):
                 print("⚠️ ElementDetectorAgent: No vision client provided")
                 return False
             
+            # Off the event loop, so callers can start other work (e.g. a browser) meanwhile
+            await asyncio.to_thread(self._load_persistent_cache)
+            
             print(f"✅ ElementDetectorAgent '{self.agent_id}' initialized with vision capabilities")
             return True
             
@@ -75,6 +98,7 @@ class ElementDetectorAgent(BaseAgent):
     async def cleanup(self) -> None:
         """Clean up detector resources."""
         try:
+            self._save_persistent_cache()
             self.cache.clear()
             print(f"✅ ElementDetectorAgent '{self.agent_id}' cleaned up")
         except Exception as e:
@@ -125,7 +149,8 @@ class ElementDetectorAgent(BaseAgent):
         self,
         screenshot_path: str,
         instruction: str,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        screenshot_bytes: Optional[bytes] = None
     ) -> ElementDetectionResult:
         """
         Detect UI element in screenshot using vision analysis.
@@ -134,6 +159,7 @@ class ElementDetectorAgent(BaseAgent):
             screenshot_path: Path to screenshot image
             instruction: Natural language instruction describing what to find
             context: Additional context about the page and previous actions
+            screenshot_bytes: Encoded screenshot already in memory; skips re-reading screenshot_path
             
         Returns:
             ElementDetectionResult with detection outcome and coordinates
@@ -144,7 +170,7 @@ class ElementDetectorAgent(BaseAgent):
         
         try:
             # Check cache first
-            cache_key = self._generate_cache_key(screenshot_path, instruction, context)
+            cache_key = self._generate_cache_key(screenshot_path, instruction, context, screenshot_bytes)
             
             if cache_key in self.cache:
                 self.cache_hits += 1
@@ -152,10 +178,18 @@ class ElementDetectorAgent(BaseAgent):
                 print(f"    🔄 Cache hit for element detection (saved ~2s)")
                 return cached_result
             
+            persisted = self._persistent_cache.get(cache_key)
+            if persisted:
+                cached_result = ElementDetectionResult.model_validate(persisted["result"])
+                self.cache[cache_key] = cached_result
+                self.cache_hits += 1
+                print("    🔄 Persistent cache hit for element detection (saved ~2s)")
+                return cached_result
+            
             self.cache_misses += 1
             
             # Verify screenshot exists
-            if not Path(screenshot_path).exists():
+            if screenshot_bytes is None and not Path(screenshot_path).exists():
                 return ElementDetectionResult(
                     found=False,
                     confidence=0.0,
@@ -178,10 +212,12 @@ class ElementDetectorAgent(BaseAgent):
             result = await self.vision_client.analyze_screenshot(
                 screenshot_path=screenshot_path,
                 instruction=instruction,
-                context=context or {}
+                context=context or {},
+                screenshot_bytes=screenshot_bytes
             )
             
-            print(f"    👁️ Vision detection result: {result.dict()}")
+            if self.debug:
+                print(f"    👁️ Vision detection result: {result.dict()}")
             # Track performance
             detection_time = time.time() - start_time
             self.detection_times.append(detection_time)
@@ -193,6 +229,12 @@ class ElementDetectorAgent(BaseAgent):
                 # Cache successful detections
                 if result.confidence > 0.7:
                     self.cache[cache_key] = result
+                    if self.cache_file:
+                        self._persistent_cache[cache_key] = {
+                            "saved_at": time.time(),
+                            "result": result.model_dump(mode="json")
+                        }
+                        self._persistent_cache_dirty = True
                     print(f"    💾 Cached high-confidence detection (confidence: {result.confidence:.2f})")
             
             print(f"    ⏱️ Vision detection took {detection_time:.2f}s")
@@ -214,20 +256,19 @@ class ElementDetectorAgent(BaseAgent):
         self, 
         screenshot_path: str, 
         instruction: str, 
-        context: Optional[Dict[str, Any]]
+        context: Optional[Dict[str, Any]],
+        screenshot_bytes: Optional[bytes] = None
     ) -> str:
         """Generate cache key for element detection."""
         
-        # Use file modification time and size for screenshot fingerprint
+        # Hash screenshot contents so identical screens share a key across runs
         try:
-            screenshot_file = Path(screenshot_path)
-            if screenshot_file.exists():
-                stat = screenshot_file.stat()
-                screenshot_fingerprint = f"{stat.st_mtime}_{stat.st_size}"
+            if screenshot_bytes is not None:
+                screenshot_fingerprint = bytes_digest(screenshot_bytes)
             else:
-                screenshot_fingerprint = "missing"
-        except Exception:
-            screenshot_fingerprint = "unknown"
+                screenshot_fingerprint = file_digest(screenshot_path)
+        except OSError:
+            screenshot_fingerprint = "missing"
         
         # Include relevant context
         context_fingerprint = ""
@@ -238,8 +279,47 @@ class ElementDetectorAgent(BaseAgent):
             context_fingerprint = str(sorted(stable_context.items()))
         
         # Combine into cache key
-        cache_key = f"{screenshot_fingerprint}_{hash(instruction)}_{hash(context_fingerprint)}"
-        return cache_key
+        return f"{screenshot_fingerprint}_{text_digest(instruction)}_{text_digest(context_fingerprint)}"
+    
+    def _load_persistent_cache(self) -> None:
+        """Load non-expired persisted detections from the cache file."""
+        if not self.cache_file or not self.cache_file.exists():
+            return
+        
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not load detection cache {self.cache_file}: {e}")
+            return
+        
+        cutoff = time.time() - self.persistent_cache_ttl
+        self._persistent_cache = {
+            key: entry for key, entry in entries.items()
+            if entry.get("saved_at", 0) >= cutoff
+        }
+        self._persistent_cache_dirty = len(self._persistent_cache) != len(entries)
+        if self._persistent_cache:
+            print(f"💾 Loaded {len(self._persistent_cache)} cached element detections")
+    
+    def _save_persistent_cache(self) -> None:
+        """Write persisted detections back to the cache file, newest first."""
+        if not self.cache_file or not self._persistent_cache_dirty:
+            return
+        
+        newest = sorted(
+            self._persistent_cache.items(),
+            key=lambda item: item[1].get("saved_at", 0),
+            reverse=True
+        )[:self.cache_size]
+        
+        try:
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(dict(newest), f)
+            self._persistent_cache_dirty = False
+        except OSError as e:
+            print(f"⚠️ Could not save detection cache {self.cache_file}: {e}")
     
     def get_detection_stats(self) -> Dict[str, Any]:
         """Get detailed detection statistics."""
@@ -6,6 +6,7 @@ Integrates with OpenAI GPT-4V for intelligent UI element identification.
 
 import base64
 import json
+import math
 import asyncio
 from typing import Dict, Any, Optional, List, Tuple
 from pathlib import Path
@@ -21,11 +22,76 @@ except ImportError:
 from ..core.models import ElementDetectionResult, BoundingBox, Coordinates
 from ..utils.credentials_loader import get_openai_credentials
 
+# Shorter image side sent to the vision model; "high" detail rescales larger images to this anyway
+VISION_SHORT_SIDE = 768
+
+# Longer image side limit accepted by the vision API
+VISION_MAX_SIDE = 2048
+
+# Characters per token assumed when a stream closes before its usage is reported
+CHARS_PER_TOKEN = 4
+
+
+def _estimated_image_tokens(image_base64: str) -> int:
+    """Input tokens billed for a "high" detail image: 85 plus 170 per 512px tile after API rescaling."""
+    try:
+        with Image.open(io.BytesIO(base64.b64decode(image_base64))) as img:
+            width, height = img.size
+    except (OSError, ValueError):
+        return 85
+    scale = min(1.0, VISION_MAX_SIDE / max(width, height))
+    scale *= min(1.0, VISION_SHORT_SIDE / (min(width, height) * scale))
+    return 85 + 170 * math.ceil(width * scale / 512) * math.ceil(height * scale / 512)
+
+
+def _first_element_span(text: str) -> Optional[Tuple[int, int]]:
+    """Span of the first complete object in a partial response's "elements" array, if received yet."""
+    key = text.find('"elements"')
+    if key < 0:
+        return None
+    
+    # Only `"elements": [ {` opens a first element; `[]` (or anything else) means there is none
+    start = key + len('"elements"')
+    for expected in ':[{':
+        while start < len(text) and text[start].isspace():
+            start += 1
+        if start >= len(text) or text[start] != expected:
+            return None
+        start += 1
+    start -= 1
+    
+    depth = 0
+    in_string = escaped = False
+    for index in range(start, len(text)):
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return start, index + 1
+    return None
+
 
 class VisionLLMClient:
     """Client for Vision-Language Model operations using OpenAI GPT-4V."""
     
-    def __init__(self, api_key: Optional[str] = None, model: Optional[str] = None, max_retries: int = 3):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        model: Optional[str] = None,
+        max_retries: int = 3,
+        early_exit: bool = True
+    ):
         """
         Initialize the Vision-LLM client.
         
@@ -33,6 +99,8 @@ class VisionLLMClient:
             api_key: OpenAI API key. If None, loads from credentials file.
             model: Model to use. If None, loads from credentials file.
             max_retries: Number of retry attempts for failed requests.
+            early_exit: Stop streaming once the first (best) element is complete; alternative
+                elements and page analysis are then not returned.
         """
         if not openai:
             raise ImportError("OpenAI package required for vision functionality")
@@ -53,9 +121,11 @@ class VisionLLMClient:
         self.client = openai.AsyncOpenAI(api_key=api_key)
         self.model = model
         self.max_retries = max_retries
+        self.early_exit = early_exit
         
-        # Cost tracking
+        # Cost tracking (streams closed early report no usage; their tokens are estimated instead)
         self.total_requests = 0
+        self.early_exits = 0
         self.estimated_cost = 0.0
         
         print(f"🔮 VisionLLMClient initialized with model: {model}")
@@ -64,7 +134,8 @@ class VisionLLMClient:
         self, 
         screenshot_path: str, 
         instruction: str,
-        context: Optional[Dict[str, Any]] = None
+        context: Optional[Dict[str, Any]] = None,
+        screenshot_bytes: Optional[bytes] = None
     ) -> ElementDetectionResult:
         """
         Analyze screenshot to find UI elements for the given instruction.
@@ -73,45 +144,60 @@ class VisionLLMClient:
             screenshot_path: Path to screenshot image
             instruction: Natural language instruction to execute
             context: Additional context about the page/previous actions
+            screenshot_bytes: Encoded screenshot already in memory; used instead of reading screenshot_path
             
         Returns:
             ElementDetectionResult with detected elements and coordinates
         """
         
-        # Prepare image for analysis
-        image_base64 = await self._prepare_image(screenshot_path)
+        # Prepare image for analysis (scale = sent image size / screenshot size)
+        image_base64, mime_type, scale = await self._prepare_image(screenshot_path, screenshot_bytes)
         
         # Generate vision prompt
         prompt = self._generate_vision_prompt(instruction, context or {})
         
         # Call vision model with retry logic
-        response = await self._call_vision_model_with_retry(image_base64, prompt)
+        response = await self._call_vision_model_with_retry(image_base64, prompt, mime_type)
         
         # Parse response into structured result
-        return await self._parse_vision_response(response, instruction)
+        return await self._parse_vision_response(response, instruction, scale)
     
-    async def _prepare_image(self, screenshot_path: str) -> str:
-        """Prepare screenshot image for vision analysis."""
+    async def _prepare_image(self, screenshot_path: str, screenshot_bytes: Optional[bytes] = None) -> Tuple[str, str, float]:
+        """
+        Prepare screenshot image for vision analysis.
+        
+        Returns:
+            Tuple of (base64 image data, MIME type, scale of the sent image relative to the screenshot)
+        """
         
         try:
-            # Load and optionally resize image
-            with Image.open(screenshot_path) as img:
-                # Convert to RGB if necessary
+            # Load and optionally resize image (from memory when the caller still holds the capture)
+            source = io.BytesIO(screenshot_bytes) if screenshot_bytes is not None else screenshot_path
+            with Image.open(source) as img:
+                scale = min(1.0, VISION_SHORT_SIDE / min(img.size), VISION_MAX_SIDE / max(img.size))
+                
+                # JPEG screenshots already at the model's resolution are sent as-is, no re-encode
+                if img.format == 'JPEG' and scale == 1.0:
+                    if screenshot_bytes is None:
+                        with open(screenshot_path, 'rb') as f:
+                            screenshot_bytes = f.read()
+                    return base64.b64encode(screenshot_bytes).decode('utf-8'), 'image/jpeg', scale
+                
+                # Convert to RGB if necessary (drops alpha, which JPEG cannot hold)
                 if img.mode != 'RGB':
                     img = img.convert('RGB')
                 
-                # Resize if too large (OpenAI has size limits)
-                max_size = 2048
-                if img.width > max_size or img.height > max_size:
-                    img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
+                # Downscale to what the model actually looks at; coordinates are scaled back later
+                if scale < 1.0:
+                    img = img.resize((round(img.width * scale), round(img.height * scale)), Image.Resampling.BILINEAR)
                     print(f"    🔄 Resized image to {img.width}x{img.height} for analysis")
                 
                 # Convert to base64
                 buffer = io.BytesIO()
-                img.save(buffer, format='PNG', optimize=True)
+                img.save(buffer, format='JPEG', quality=75)
                 image_bytes = buffer.getvalue()
                 
-                return base64.b64encode(image_bytes).decode('utf-8')
+                return base64.b64encode(image_bytes).decode('utf-8'), 'image/jpeg', scale
                 
         except Exception as e:
             raise Exception(f"Failed to prepare image {screenshot_path}: {e}")
@@ -181,49 +267,26 @@ Analyze this webpage screenshot to help execute the instruction: "{instruction}"
         
         prompt += """
 
-**Response Format (JSON only):**
-{{
-    "elements": [
-        {{
-            "element_type": "button|input|link|dropdown|tab|text|etc",
-            "description": "Brief description of the element",
-            "bounding_box": {{"x": 0, "y": 0, "width": 0, "height": 0}},
-            "center_coordinates": {{"x": 0, "y": 0}},
-            "confidence": 0.95,
-            "visible_text": "text content if any",
-            "attributes": {{"class": "button-class", "placeholder": "hint text"}},
-            "interaction_type": "click|type|hover|scroll\""""
+**Response Format (compact JSON only):**
+{"elements":[{"element_type":"button|input|link|dropdown|tab|text|etc","description":"brief description","bounding_box":{"x":0,"y":0,"width":0,"height":0},"center_coordinates":{"x":0,"y":0},"confidence":0.95,"visible_text":"text if any","attributes":{"class":"...","placeholder":"..."},"interaction_type":"click|type|hover|scroll\""""
         
         # Add context-specific fields if UI context exists
         if ui_context_type:
-            prompt += f""",
-            "ui_context_match": "true|false - whether element is in correct {ui_context_type}",
-            "context_region": {{"x": 0, "y": 0, "width": 0, "height": 0}} // bounding box of the {ui_context_type} region"""
+            prompt += f""","ui_context_match":"true|false","context_region":{{"x":0,"y":0,"width":0,"height":0}}"""
         
-        prompt += """
-        }}
-    ],
-    "page_analysis": {{
-        "layout_type": "form|dashboard|list|search|landing|etc",
-        "main_content_area": {{"x": 0, "y": 0, "width": 0, "height": 0}},
-        "notable_elements": ["list of other important elements visible"],
-        "potential_issues": ["any automation challenges detected"]"""
+        prompt += """}],"page_analysis":{"layout_type":"form|dashboard|list|search|landing|etc","main_content_area":{"x":0,"y":0,"width":0,"height":0},"notable_elements":["..."],"potential_issues":["..."]"""
         
         # Add context analysis if UI context exists
         if ui_context_type:
-            prompt += f""",
-        "ui_context_analysis": {{
-            "context_type": "{ui_context_type}",
-            "context_found": "true|false",
-            "context_region": {{"x": 0, "y": 0, "width": 0, "height": 0}},
-            "context_confidence": 0.95
-        }}"""
+            prompt += f""","ui_context_analysis":{{"context_type":"{ui_context_type}","context_found":"true|false","context_region":{{"x":0,"y":0,"width":0,"height":0}},"context_confidence":0.95}}"""
+        
+        prompt += """},"overall_confidence":0.85,"recommendation":"primary action to take"}"""
+        
+        if ui_context_type:
+            prompt += f"""
+(context_region is the bounding box of the {ui_context_type} region)"""
         
         prompt += """
-    }},
-    "overall_confidence": 0.85,
-    "recommendation": "Primary action to take based on analysis"
-}}
 
 **Important:** """
         
@@ -243,14 +306,16 @@ Analyze this webpage screenshot to help execute the instruction: "{instruction}"
         
         return prompt
     
-    async def _call_vision_model_with_retry(self, image_base64: str, prompt: str) -> Dict[str, Any]:
+    async def _call_vision_model_with_retry(
+        self, image_base64: str, prompt: str, mime_type: str = "image/png"
+    ) -> Dict[str, Any]:
         """Call vision model with retry logic."""
         
         for attempt in range(self.max_retries):
             try:
                 print(f"    🔮 Calling vision model (attempt {attempt + 1}/{self.max_retries})")
                 
-                response = await self.client.chat.completions.create(
+                stream = await self.client.chat.completions.create(
                     model=self.model,
                     messages=[
                         {
@@ -263,7 +328,7 @@ Analyze this webpage screenshot to help execute the instruction: "{instruction}"
                                 {
                                     "type": "image_url",
                                     "image_url": {
-                                        "url": f"data:image/png;base64,{image_base64}",
+                                        "url": f"data:{mime_type};base64,{image_base64}",
                                         "detail": "high"
                                     }
                                 }
@@ -271,19 +336,50 @@ Analyze this webpage screenshot to help execute the instruction: "{instruction}"
                         }
                     ],
                     max_tokens=1500,
-                    temperature=0.1  # Low temperature for consistent results
+                    temperature=0.1,  # Low temperature for consistent results
+                    stream=True,
+                    stream_options={"include_usage": True}
                 )
+                self.total_requests += 1
+                
+                # Only the first element is used for the action, and the model writes it first:
+                # stop generating as soon as it is complete
+                content = ""
+                usage = None
+                early_exit = self.early_exit
+                try:
+                    async for chunk in stream:
+                        if chunk.usage:
+                            usage = chunk.usage
+                        if not chunk.choices or not chunk.choices[0].delta.content:
+                            continue
+                        content += chunk.choices[0].delta.content
+                        
+                        span = _first_element_span(content) if early_exit else None
+                        if span:
+                            try:
+                                first_element = json.loads(content[span[0]:span[1]])
+                            except json.JSONDecodeError:
+                                continue
+                            # An element without a click point is no answer; read the full response
+                            if not isinstance(first_element, dict) or "center_coordinates" not in first_element:
+                                early_exit = False
+                                continue
+                            self.early_exits += 1
+                            # The image and prompt are billed in full even though usage never arrives
+                            self._add_cost(
+                                _estimated_image_tokens(image_base64) + len(prompt) // CHARS_PER_TOKEN,
+                                len(content) // CHARS_PER_TOKEN
+                            )
+                            return {"elements": [first_element]}
+                finally:
+                    await stream.close()
                 
                 # Track usage for cost estimation
-                self.total_requests += 1
-                if hasattr(response, 'usage'):
-                    # Rough cost estimation (GPT-4V pricing)
-                    input_tokens = response.usage.prompt_tokens
-                    output_tokens = response.usage.completion_tokens
-                    cost = (input_tokens * 0.01 / 1000) + (output_tokens * 0.03 / 1000)
-                    self.estimated_cost += cost
+                if usage:
+                    self._add_cost(usage.prompt_tokens, usage.completion_tokens)
                 
-                content = response.choices[0].message.content.strip()
+                content = content.strip()
                 
                 # Parse JSON response
                 try:
@@ -303,8 +399,12 @@ Analyze this webpage screenshot to help execute the instruction: "{instruction}"
                     raise Exception(f"Vision model failed after {self.max_retries} attempts: {e}")
                 await asyncio.sleep(2 ** attempt)  # Exponential backoff
     
-    async def _parse_vision_response(self, response: Dict[str, Any], instruction: str) -> ElementDetectionResult:
-        """Parse vision model response into structured result."""
+    def _add_cost(self, input_tokens: int, output_tokens: int) -> None:
+        """Add a call's rough cost (GPT-4V pricing) to the running estimate."""
+        self.estimated_cost += (input_tokens * 0.01 / 1000) + (output_tokens * 0.03 / 1000)
+    
+    async def _parse_vision_response(self, response: Dict[str, Any], instruction: str, scale: float = 1.0) -> ElementDetectionResult:
+        """Parse vision model response into structured result, mapping coordinates back to screenshot pixels."""
         
         try:
             # Extract primary element
@@ -324,15 +424,15 @@ Analyze this webpage screenshot to help execute the instruction: "{instruction}"
             center_coords_data = primary_element.get('center_coordinates', {})
             
             bounding_box = BoundingBox(
-                x=bounding_box_data.get('x', 0),
-                y=bounding_box_data.get('y', 0),
-                width=bounding_box_data.get('width', 0),
-                height=bounding_box_data.get('height', 0)
+                x=round(bounding_box_data.get('x', 0) / scale),
+                y=round(bounding_box_data.get('y', 0) / scale),
+                width=round(bounding_box_data.get('width', 0) / scale),
+                height=round(bounding_box_data.get('height', 0) / scale)
             )
             
             center_coordinates = Coordinates(
-                x=center_coords_data.get('x', 0),
-                y=center_coords_data.get('y', 0)
+                x=round(center_coords_data.get('x', 0) / scale),
+                y=round(center_coords_data.get('y', 0) / scale)
             )
             
             # Build result
@@ -367,6 +467,7 @@ Analyze this webpage screenshot to help execute the instruction: "{instruction}"
         """Get usage statistics for cost tracking."""
         return {
             "total_requests": self.total_requests,
+            "early_exits": self.early_exits,
             "estimated_cost": round(self.estimated_cost, 4),
             "model": self.model
         }
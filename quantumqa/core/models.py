@@ -105,6 +105,8 @@ class AgentMessage:
 @dataclass
 class Coordinates:
     """Screen coordinates."""
+    __slots__ = ("x", "y")
+    
     x: int
     y: int
 
@@ -6,10 +6,14 @@ Maintains awareness of opened dropdowns, modals, and other interactive regions.
 
 import re
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional, List, Set
+from typing import Dict, Any, Optional, List, Set, Tuple
 from enum import Enum
 
 
+# Most contexts kept open at once; the oldest is dropped when another opens
+MAX_ACTIVE_CONTEXTS = 16
+
+
 class UIElementType(Enum):
     """Types of UI elements that can affect context."""
     DROPDOWN = "dropdown"
@@ -50,9 +54,13 @@ class UIContextManager:
     """
     
     def __init__(self):
+        # Insertion-ordered, so the first key is always the oldest context
         self.active_contexts: Dict[str, UIElementContext] = {}
         self.context_history: List[Dict[str, Any]] = []
         
+        # get_context_summary() result, reset whenever active_contexts changes
+        self._summary: Optional[str] = None
+        
         # Patterns to detect context-creating actions
         self.dropdown_patterns = [
             r"click.*dropdown", r"open.*dropdown", r"expand.*dropdown",
@@ -70,6 +78,31 @@ class UIContextManager:
             r"click.*from.*menu", r"select.*from.*menu",
             r"click.*button.*from.*dropdown", r"click.*option"
         ]
+        
+        # Each pattern family compiled into one alternation, scanned once per step
+        self._dropdown_regex = re.compile("|".join(self.dropdown_patterns))
+        self._modal_regex = re.compile("|".join(self.modal_patterns))
+        self._scoped_action_regex = re.compile("|".join(self.scoped_action_patterns))
+    
+    def analyze_and_check(
+        self, step_number: int, instruction: str
+    ) -> Tuple[Optional[UIElementContext], Optional[Dict[str, Any]]]:
+        """
+        Run analyze_step_for_context and check_if_step_needs_context in one pass.
+        
+        Args:
+            step_number: Current step number
+            instruction: The instruction text
+            
+        Returns:
+            Tuple of (context created by this step, context info the step needs)
+        """
+        instruction_lower = instruction.lower()
+        # Expire contexts every step, not only on scoped steps, so they cannot pile up
+        self._cleanup_expired_contexts(step_number)
+        created = self._detect_context_creation(step_number, instruction, instruction_lower)
+        needed = self._detect_context_needed(step_number, instruction_lower)
+        return created, needed
     
     def analyze_step_for_context(self, step_number: int, instruction: str) -> Optional[UIElementContext]:
         """
@@ -82,51 +115,60 @@ class UIContextManager:
         Returns:
             UIElementContext if the step creates new context, None otherwise
         """
-        instruction_lower = instruction.lower()
+        return self._detect_context_creation(step_number, instruction, instruction.lower())
+    
+    def _detect_context_creation(
+        self, step_number: int, instruction: str, instruction_lower: str
+    ) -> Optional[UIElementContext]:
+        """Register and return a context opened by this step, if any."""
         
         # Check for dropdown context creation
-        for pattern in self.dropdown_patterns:
-            if re.search(pattern, instruction_lower):
-                # Extract the target description
-                target = self._extract_target_from_instruction(instruction)
-                
-                context = UIElementContext(
-                    element_type=UIElementType.DROPDOWN,
-                    state=UIState.OPENED,
-                    step_opened=step_number,
-                    target_description=target,
-                    region_hint=f"dropdown opened in step {step_number}",
-                    action_keywords={"dropdown", "menu", "option", "select"}
-                )
-                
-                context_key = f"dropdown_{step_number}"
-                self.active_contexts[context_key] = context
-                
-                print(f"    🎯 UIContextManager: Detected dropdown context creation - {target}")
-                return context
+        if self._dropdown_regex.search(instruction_lower):
+            # Extract the target description
+            target = self._extract_target_from_instruction(instruction)
+            
+            context = UIElementContext(
+                element_type=UIElementType.DROPDOWN,
+                state=UIState.OPENED,
+                step_opened=step_number,
+                target_description=target,
+                region_hint=f"dropdown opened in step {step_number}",
+                action_keywords={"dropdown", "menu", "option", "select"}
+            )
+            
+            self._add_context(f"dropdown_{step_number}", context)
+            
+            print(f"    🎯 UIContextManager: Detected dropdown context creation - {target}")
+            return context
         
         # Check for modal context creation
-        for pattern in self.modal_patterns:
-            if re.search(pattern, instruction_lower):
-                target = self._extract_target_from_instruction(instruction)
-                
-                context = UIElementContext(
-                    element_type=UIElementType.MODAL,
-                    state=UIState.OPENED,
-                    step_opened=step_number,
-                    target_description=target,
-                    region_hint=f"modal opened in step {step_number}",
-                    action_keywords={"modal", "dialog", "popup"}
-                )
-                
-                context_key = f"modal_{step_number}"
-                self.active_contexts[context_key] = context
-                
-                print(f"    🎯 UIContextManager: Detected modal context creation - {target}")
-                return context
+        if self._modal_regex.search(instruction_lower):
+            target = self._extract_target_from_instruction(instruction)
+            
+            context = UIElementContext(
+                element_type=UIElementType.MODAL,
+                state=UIState.OPENED,
+                step_opened=step_number,
+                target_description=target,
+                region_hint=f"modal opened in step {step_number}",
+                action_keywords={"modal", "dialog", "popup"}
+            )
+            
+            self._add_context(f"modal_{step_number}", context)
+            
+            print(f"    🎯 UIContextManager: Detected modal context creation - {target}")
+            return context
         
         return None
     
+    def _add_context(self, context_key: str, context: UIElementContext) -> None:
+        """Register an opened context, dropping the oldest beyond MAX_ACTIVE_CONTEXTS."""
+        self.active_contexts.pop(context_key, None)
+        self.active_contexts[context_key] = context
+        while len(self.active_contexts) > MAX_ACTIVE_CONTEXTS:
+            self.active_contexts.pop(next(iter(self.active_contexts)))
+        self._summary = None
+    
     def check_if_step_needs_context(self, step_number: int, instruction: str) -> Optional[Dict[str, Any]]:
         """
         Check if a step needs to be executed within a specific UI context.
@@ -138,12 +180,13 @@ class UIContextManager:
         Returns:
             Dictionary with context information if step needs scoping, None otherwise
         """
-        instruction_lower = instruction.lower()
+        return self._detect_context_needed(step_number, instruction.lower())
+    
+    def _detect_context_needed(self, step_number: int, instruction_lower: str) -> Optional[Dict[str, Any]]:
+        """Return scoping info when this step acts inside an already opened context."""
         
         # Check if this is a context-dependent action
-        is_scoped_action = any(re.search(pattern, instruction_lower) for pattern in self.scoped_action_patterns)
-        
-        if not is_scoped_action:
+        if not self._scoped_action_regex.search(instruction_lower):
             return None
         
         # Find the most relevant active context
@@ -235,6 +278,8 @@ class UIContextManager:
             if steps_since_opened > context.expected_lifetime:
                 expired_keys.append(context_key)
         
+        if expired_keys:
+            self._summary = None
         for key in expired_keys:
             expired_context = self.active_contexts.pop(key)
             print(f"    🧹 UIContextManager: Expired {expired_context.element_type.value} context from step {expired_context.step_opened}")
@@ -242,6 +287,7 @@ class UIContextManager:
     def close_context(self, context_key: str):
         """Manually close a specific context."""
         if context_key in self.active_contexts:
+            self._summary = None
             closed_context = self.active_contexts.pop(context_key)
             print(f"    🚪 UIContextManager: Closed {closed_context.element_type.value} context from step {closed_context.step_opened}")
     
@@ -252,16 +298,14 @@ class UIContextManager:
     def clear_all_contexts(self):
         """Clear all active contexts."""
         self.active_contexts.clear()
+        self._summary = None
         print("    🧹 UIContextManager: Cleared all contexts")
     
     def get_context_summary(self) -> str:
-        """Get a human-readable summary of active contexts."""
-        if not self.active_contexts:
-            return "No active UI contexts"
-        
-        summaries = []
-        for context_key, context in self.active_contexts.items():
-            summary = f"{context.element_type.value} ({context.target_description}) opened in step {context.step_opened}"
-            summaries.append(summary)
-        
-        return "; ".join(summaries)
+        """Get a human-readable summary of active contexts (rebuilt only after they change)."""
+        if self._summary is None:
+            self._summary = "; ".join(
+                f"{context.element_type.value} ({context.target_description}) opened in step {context.step_opened}"
+                for context in self.active_contexts.values()
+            ) or "No active UI contexts"
+        return self._summary
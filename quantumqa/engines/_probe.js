@@ -0,0 +1,197 @@
+// QuantumQA page helpers, installed once per page (init script + current document).
+// Python calls them by name with arguments instead of re-sending script bodies.
+(() => {
+    const CLICKABLE = 'button, a, input, select, textarea, [role="button"], [role="link"]';
+    const TYPEABLE = 'input, textarea, [contenteditable=""], [contenteditable="true" i]';
+    
+    // Mutations made by our own click highlight (and its <style> in head) are not page activity
+    const isHighlight = (node) => node.id === 'quantum-click-target';
+    const isOwnChange = (record) =>
+        record.target === document.head || isHighlight(record.target) ||
+        (record.type === 'childList' &&
+         [...record.addedNodes, ...record.removedNodes].every(isHighlight));
+    
+    // Whether an element accepts the given action; allowPointer also accepts cursor:pointer styling
+    window.__qq_isInteractive = (element, action, allowPointer) => {
+        if (action === 'click') {
+            return element.matches(CLICKABLE) ||
+                   element.onclick !== null ||
+                   (!!allowPointer && element.style.cursor === 'pointer');
+        }
+        if (action === 'type') {
+            return element.matches(TYPEABLE);
+        }
+        return false;
+    };
+    
+    window.__qq_isInteractiveAt = (x, y, action) => {
+        const element = document.elementFromPoint(x, y);
+        return !!element && window.__qq_isInteractive(element, action, true);
+    };
+    
+    // Document ready state plus a summary of the element at a point (click diagnostics)
+    window.__qq_describeAt = (x, y) => {
+        const element = document.elementFromPoint(x, y);
+        return {
+            ready: document.readyState,
+            element: element ? {
+                tagName: element.tagName,
+                id: element.id || '',
+                className: element.className || '',
+                textContent: element.textContent ? element.textContent.substring(0, 50) : '',
+                type: element.type || '',
+                placeholder: element.placeholder || '',
+                name: element.name || '',
+                role: element.getAttribute('role') || '',
+                ariaLabel: element.getAttribute('aria-label') || ''
+            } : null
+        };
+    };
+    
+    // DOM click on the element at a point, for when a real mouse click fails
+    window.__qq_clickAt = (x, y) => {
+        const element = document.elementFromPoint(x, y);
+        if (!element) return false;
+        element.click();
+        return true;
+    };
+    
+    // Red pulsing ring where we are about to click; the keyframes are added to the page once
+    window.__qq_highlightAt = (x, y) => {
+        if (!document.getElementById('quantum-click-style')) {
+            const style = document.createElement('style');
+            style.id = 'quantum-click-style';
+            style.textContent = `
+                @keyframes quantum-pulse {
+                    0% { transform: scale(0.5); opacity: 1; }
+                    50% { transform: scale(1.2); opacity: 0.8; }
+                    100% { transform: scale(1); opacity: 0.6; }
+                }
+            `;
+            document.head.appendChild(style);
+        }
+        
+        // Remove any existing highlights
+        const existing = document.getElementById('quantum-click-target');
+        if (existing) existing.remove();
+        
+        const highlight = document.createElement('div');
+        highlight.id = 'quantum-click-target';
+        highlight.style.cssText = `
+            position: fixed;
+            left: ${x - 15}px;
+            top: ${y - 15}px;
+            width: 30px;
+            height: 30px;
+            border: 3px solid #ff0000;
+            border-radius: 50%;
+            background: rgba(255, 0, 0, 0.2);
+            z-index: 999999;
+            pointer-events: none;
+            animation: quantum-pulse 0.8s ease-in-out;
+        `;
+        document.body.appendChild(highlight);
+        
+        // Auto-remove after 1 second
+        setTimeout(() => highlight.remove(), 1000);
+    };
+    
+    // Resolves window.__qq_mutationPromise with 'mutation' on the first DOM change made by the
+    // page after arming, or 'timeout' after timeoutMs
+    window.__qq_watchMutations = (timeoutMs) => {
+        window.__qq_mutationPromise = new Promise((resolve) => {
+            const finish = (reason) => {
+                observer.disconnect();
+                clearTimeout(timer);
+                resolve(reason);
+            };
+            const observer = new MutationObserver((records) => {
+                if (!records.every(isOwnChange)) finish('mutation');
+            });
+            const timer = setTimeout(() => finish('timeout'), timeoutMs);
+            observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true});
+        });
+        return true;
+    };
+    
+    // Milliseconds since the page last changed the DOM, kept by one long-lived observer.
+    // __qq_visualVersion also counts typing, scrolling (of any container: capture phase), resource
+    // loads and finished transitions/animations, which change pixels but not the DOM
+    if (!window.__qq_domObserver) {
+        window.__qq_lastMutation = Date.now();
+        window.__qq_visualVersion = 0;
+        window.__qq_domObserver = new MutationObserver((records) => {
+            if (!records.every(isOwnChange)) {
+                window.__qq_lastMutation = Date.now();
+                window.__qq_visualVersion++;
+            }
+        });
+        window.__qq_domObserver.observe(document, {childList: true, subtree: true, attributes: true});
+        const bumpVisual = () => { window.__qq_visualVersion++; };
+        for (const type of ['input', 'scroll', 'load', 'transitionend', 'animationend']) {
+            document.addEventListener(type, bumpVisual, {capture: true, passive: true});
+        }
+        window.addEventListener('resize', bumpVisual, {passive: true});
+    }
+    window.__qq_domIdleMs = () => Date.now() - window.__qq_lastMutation;
+    
+    // Semantic search + expanding-circle scan for an interactive element, in one round-trip
+    window.__qq_findNearby = ({x, y, action, offsets, semanticSelectors}) => {
+        const center = (element) => {
+            const rect = element.getBoundingClientRect();
+            return {x: rect.left + rect.width / 2, y: rect.top + rect.height / 2};
+        };
+        
+        for (const selector of semanticSelectors) {
+            const element = document.querySelector(selector);
+            if (element && element.offsetParent !== null) { // Check if visible
+                return {source: 'semantic', selector, tag: element.tagName.toLowerCase(), ...center(element)};
+            }
+        }
+        
+        // Check points in circles of increasing radius around the original coordinates.
+        // Neighbouring samples mostly hit the same few elements, so test each element once;
+        // hit-testing only reads layout, and the rect is read for the winner alone
+        const checked = new Set();
+        for (const [radius, points] of offsets) {
+            for (const [dx, dy] of points) {
+                const element = document.elementFromPoint(x + dx, y + dy);
+                if (!element || checked.has(element)) continue;
+                checked.add(element);
+                if (window.__qq_isInteractive(element, action, false)) {
+                    return {
+                        source: 'radius',
+                        radius,
+                        tag: element.tagName.toLowerCase(),
+                        id: element.id,
+                        name: element.name,
+                        ...center(element)
+                    };
+                }
+            }
+        }
+        return null;
+    };
+    
+    // Unique CSS selector for the interactive element at a point, built from stable attributes only
+    window.__qq_stableSelectorAt = (x, y) => {
+        const hit = document.elementFromPoint(x, y);
+        // Only interactive elements are worth a selector; a container's id would match the wrong thing
+        const element = hit && hit.closest(`${CLICKABLE}, ${TYPEABLE}`);
+        if (!element) return null;
+        
+        const tag = element.tagName.toLowerCase();
+        const candidates = [];
+        for (const attr of ['data-testid', 'data-test', 'data-qa']) {
+            const value = element.getAttribute(attr);
+            if (value) candidates.push(`[${attr}="${CSS.escape(value)}"]`);
+        }
+        // Skip ids that look generated (e.g. "input-48213")
+        if (element.id && !/\d{3,}/.test(element.id)) candidates.push(`#${CSS.escape(element.id)}`);
+        for (const attr of ['name', 'aria-label']) {
+            const value = element.getAttribute(attr);
+            if (value) candidates.push(`${tag}[${attr}="${CSS.escape(value)}"]`);
+        }
+        return candidates.find((selector) => document.querySelectorAll(selector).length === 1) || null;
+    };
+})();
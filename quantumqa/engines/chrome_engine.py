@@ -576,8 +576,10 @@ class ChromeEngine:
             if self.gif_creator.get_screenshot_count() > 1:
                 # Use run_name as custom filename if provided, otherwise use title-based naming
                 custom_filename = f"{self.run_name}.gif" if self.run_name else None
-                gif_path = self.gif_creator.create_gif(
-                    "reports", 
+                # Decoding and quantizing every frame is CPU-bound, so keep it off the event loop
+                gif_path = await asyncio.to_thread(
+                    self.gif_creator.create_gif,
+                    "reports",
                     title=f"chrome_test_{clean_filename}",
                     custom_filename=custom_filename
                 )
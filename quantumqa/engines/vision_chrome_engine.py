@@ -5,18 +5,182 @@ Uses computer vision and LLMs for intelligent element finding instead of hardcod
 """
 
 import asyncio
+import base64
+import json
+import math
+import os
+import re
 import time
+from itertools import chain
 from pathlib import Path
 from typing import List, Dict, Any, Optional
-from playwright.async_api import async_playwright, Page, Browser, BrowserContext
+from urllib.parse import urlparse
+from playwright.async_api import async_playwright, TimeoutError as PlaywrightTimeoutError
 
 from ..parsers.instruction_parser import InstructionParser
 from ..executors.action_executor import ActionExecutor
 from ..agents.element_detector import ElementDetectorAgent
+from ..finders.element_finder import ElementFinder
 from ..core.llm import VisionLLMClient
 from ..core.ui_context_manager import UIContextManager
-from ..core.models import ElementDetectionResult, Coordinates
+from ..core.models import Coordinates
+from ..utils.credentials_loader import CredentialsLoader
 from ..utils.gif_creator import GifCreator
+from ..utils.hashing import bytes_digest, file_digest, text_digest, image_ahash, hamming_distance
+
+# Analytics/tracker URLs blocked natively by Chrome in performance mode (CDP wildcard patterns).
+# These also block documents, so only tracker hosts and tracker script paths: never a bare
+# name like */analytics*, which would catch facebook.com pages or an app's own /analytics section
+BLOCKED_URL_PATTERNS = [
+    "*google-analytics.com/*",
+    "*googletagmanager.com/*",
+    "*doubleclick.net/*",
+    "*googlesyndication.com/*",
+    "*connect.facebook.net/*",
+    "*platform.twitter.com/*",
+    "*segment.io/*",
+    "*cdn.segment.com/*",
+    "*static.hotjar.com/*",
+    "*script.hotjar.com/*",
+    "*.hotjar.io/*",
+    "*/analytics.js*",
+    "*/gtag.js*",
+    "*/gtag/js*",
+]
+
+# Launch errors meaning another browser already holds the persistent profile
+PROFILE_IN_USE_PATTERN = re.compile(r"ProcessSingleton|SingletonLock|profile appears to be in use", re.IGNORECASE)
+
+# Credential references in typed text, e.g. {cred:aihub.email}
+CREDENTIAL_REFERENCE_PATTERN = re.compile(r'\{(?:cred|credential|creds):([^}]+)\}')
+
+# Page helpers from _probe.js, installed once per page (init script + current document)
+JS_HELPERS = Path(__file__).with_name("_probe.js").read_text(encoding="utf-8")
+
+# Search fields tried before scanning around vision coordinates for a click
+SEMANTIC_SEARCH_SELECTORS = [
+    'input[name="q"]',                  # Google search
+    'input[type="search"]',             # Search inputs
+    'input[placeholder*="search" i]',   # Search placeholders
+    'input[aria-label*="search" i]',    # Search aria labels
+    '[role="searchbox"]',               # Search role
+    'input[name="search"]',             # Search name
+    'textarea[name="q"]',               # Alternative search
+    'input[name="query"]'               # Query inputs
+]
+
+# Radii (px) of the circles sampled around inaccurate vision coordinates
+NEARBY_SEARCH_RADII = [15, 30, 60, 120, 200]
+
+# Integer (dx, dy) offsets sampled every 30 degrees on each circle, computed once
+NEARBY_SEARCH_OFFSETS = [
+    [radius, [
+        [round(radius * math.cos(math.radians(angle))), round(radius * math.sin(math.radians(angle)))]
+        for angle in range(0, 360, 30)
+    ]]
+    for radius in NEARBY_SEARCH_RADII
+]
+
+# Action plan keys forwarded to the vision detector when a step is scoped to a UI context
+UI_CONTEXT_FIELDS = ("ui_context_type", "ui_context_target", "ui_context_opened_step", "search_scope", "context_keywords")
+
+# Longest an unchanged page's analysis screenshot is reused; canvas, video and running
+# animations repaint without any event the page version could count
+ANALYSIS_SHOT_REUSE_SECONDS = 3.0
+
+# Max perceptual-hash bits a screenshot may differ by and still reuse coordinates found on an earlier one
+SIMILAR_SHOT_MAX_DISTANCE = 6
+
+# Screenshots remembered per (action, page, viewport, target) in the similar-screenshot cache
+SIMILAR_SHOT_ENTRIES_PER_TARGET = 4
+
+# Consecutive misses (selector matches nothing visible) after which a learned selector is forgotten;
+# a selector that matches a different element is forgotten at once
+LEARNED_SELECTOR_MAX_MISSES = 2
+
+# Element fields that must match before coordinates from a similar screenshot are reused
+ELEMENT_SIGNATURE_FIELDS = ("tagName", "id", "name", "type", "placeholder", "role", "ariaLabel", "textContent")
+
+# Keyword families for inferring the action of an unrecognized instruction, checked in order:
+# (action, keywords, whether the target follows the keyword rather than being the whole instruction)
+INFERRED_ACTION_PATTERNS = [
+    ("verify", re.compile(r"look for|find|locate|search for"), True),
+    ("click", re.compile(r"click|tap|press|select"), True),
+    ("type", re.compile(r"type|enter|input"), False),
+    ("verify", re.compile(r"verify|check|ensure|confirm"), False),
+]
+
+# Filler words stripped from the start of an inferred target ("that the submit button" -> "submit button")
+LEADING_FILLER_PATTERN = re.compile(r"^(?:(?:that|the|is|are|should|be|in|on|at)\s+)+")
+
+# Stop words filtered out of targets and AI-normalized terms
+STOP_WORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
+    'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
+    'to', 'was', 'were', 'will', 'with', 'would', 'this', 'these',
+    'those', 'they', 'there', 'their', 'then', 'than', 'them', 'can',
+    'could', 'should', 'may', 'might', 'must', 'shall', 'do',
+    'does', 'did', 'have', 'had', 'been', 'being'
+})
+
+# Synonyms added by the non-AI normalization fallback when a target mentions the key
+BASIC_SYNONYMS = {
+    "workspaces": ["workspace", "work space", "projects"],
+    # Ensure 'create dropdown' also searches for 'create'
+    "create dropdown": ["create", "new", "add", "+"],
+    "create": ["new", "add", "+"],
+    "menu": ["navigation", "nav"],
+    "sign in": ["login", "log in", "signin"],
+    "my": ["my", "mine", "personal"],
+    "conversation": ["chat", "conversation", "messaging"]
+}
+
+# Single-word synonym keys are looked up per target word; phrases still need a substring test
+BASIC_SYNONYM_WORDS = {key: values for key, values in BASIC_SYNONYMS.items() if " " not in key}
+BASIC_SYNONYM_PHRASES = tuple((key, values) for key, values in BASIC_SYNONYMS.items() if " " in key)
+
+WORD_PATTERN = re.compile(r"\w+")
+
+# Keywords that enable the optional smart-selector template groups. Substring matches, so
+# compounds count too ("textarea", "searchbar", "createbutton"); one regex search per group
+DROPDOWN_SELECTOR_PATTERN = re.compile(r"dropdown|create")
+LINK_SELECTOR_PATTERN = re.compile(r"workspace|sign in|login")
+INPUT_SELECTOR_PATTERN = re.compile(r"query|search|input|text|message|files")
+
+# Single-word targets common enough that basic normalization matches what the AI would return
+KNOWN_SINGLE_WORD_TARGETS = frozenset({
+    'add', 'apply', 'back', 'cancel', 'close', 'confirm', 'continue', 'create',
+    'delete', 'done', 'download', 'edit', 'filter', 'help', 'home', 'login',
+    'logout', 'menu', 'new', 'next', 'no', 'ok', 'open', 'profile', 'refresh',
+    'register', 'save', 'search', 'send', 'settings', 'share', 'signin', 'signup',
+    'submit', 'upload', 'yes'
+})
+
+# Static instructions for text-only instruction normalization. Kept as the leading
+# system message so repeated calls share an identical prompt prefix
+NORMALIZATION_SYSTEM_PROMPT = """You are a UI automation expert. Convert human language instructions into standardized terms that work well with CSS selectors.
+
+Provide 3-5 alternative terms/phrases that could represent the same UI element:
+1. Exact term variations (singular/plural, capitalization)
+2. Common synonyms
+3. Abbreviated forms
+4. Context-appropriate alternatives
+
+IMPORTANT: Focus on meaningful UI element terms, avoid stop words like 'on', 'the', 'to', 'from', etc.
+
+Return only a JSON object with a "terms" list of strings, no explanation:
+{"terms": ["term1", "term2", "term3", ...]}
+
+Examples:
+- "workspaces" → {"terms": ["workspaces", "workspace", "Workspaces", "work space", "projects"]}
+- "main menu" → {"terms": ["menu", "navigation", "nav", "main menu", "header menu"]}
+- "create button" → {"terms": ["create", "Create", "new", "+", "add", "create button"]}
+- "sign in" → {"terms": ["sign in", "login", "log in", "signin", "Log In", "Sign In"]}"""
+
+# Per-call details appended after the static prefix
+NORMALIZATION_USER_TEMPLATE = """INSTRUCTION: "{action} on {clean_target}"
+ORIGINAL TARGET: "{target}"
+PAGE CONTEXT: {title} ({url})"""
 
 
 class VisionChromeEngine:
@@ -25,6 +189,61 @@ class VisionChromeEngine:
     Combines traditional automation with computer vision for robust testing.
     """
     
+    # Smart selector templates as (template, strategy, priority); {t} is the target, {tl} its lowercase form
+    _DROPDOWN_SCOPED_TEMPLATES = (
+        ("[role='menu'] [role='menuitem']:has-text('{t}')", "dropdown_menuitem", 0),
+        ("[role='menu'] button:has-text('{t}')", "dropdown_button", 0),
+        ("[role='menu'] *:has-text('{t}')", "dropdown_any", 0),
+        ("[aria-expanded='true'] + * [role='menuitem']:has-text('{t}')", "expanded_dropdown_item", 0),
+        ("[aria-expanded='true'] + * button:has-text('{t}')", "expanded_dropdown_button", 0),
+        ("[class*='dropdown'][class*='open'] *:has-text('{t}')", "open_dropdown_item", 0),
+        ("[class*='menu'][style*='block'] *:has-text('{t}')", "visible_menu_item", 0),
+    )
+    _DROPDOWN_BUTTON_TEMPLATES = (
+        ("button:has-text('{t}')[aria-haspopup='true']:not([role='tab'])", "dropdown_button_aria", 1),
+        ("button:has-text('{t}')[aria-expanded]:not([role='tab'])", "dropdown_button_expanded", 1),
+        ("button:has-text('{t}'):has(svg, [class*='arrow'], [class*='chevron'])", "button_with_arrow", 2),
+        ("button:has-text('{t}')[class*='dropdown']:not([role='tab'])", "dropdown_button_class", 3),
+    )
+    _BUTTON_TEMPLATES = (
+        ("button:has-text('{t}'):not([role='tab'])", "button_not_tab", 3),
+        ("[role='button']:has-text('{t}'):not([role='tab'])", "role_button_not_tab", 4),
+        ("button:has-text('{t}')", "button_text", 5),
+    )
+    _LINK_TEMPLATES = (
+        ("a:has-text('{t}')", "link_text", 5),
+        ("[href*='{tl}']", "link_href", 6),
+    )
+    _MENU_ITEM_TEMPLATES = (
+        ("[role='menuitem']:has-text('{t}')", "menu_item", 6),
+        ("li:has-text('{t}')", "list_item", 7),
+    )
+    _INPUT_TEMPLATES = (
+        ("input[placeholder*='{t}' i]", "input_placeholder", 2),
+        ("textarea[placeholder*='{t}' i]", "textarea_placeholder", 2),
+        ("[contenteditable][placeholder*='{t}' i]", "contenteditable_placeholder", 2),
+        ("input[aria-label*='{t}' i]", "input_aria_label", 3),
+        ("textarea[aria-label*='{t}' i]", "textarea_aria_label", 3),
+        ("div:has-text('{t}') input", "labeled_input", 4),
+        ("div:has-text('{t}') textarea", "labeled_textarea", 4),
+    )
+    _GENERIC_TEMPLATES = (
+        ("*:has-text('{t}')[onclick]", "clickable_element", 8),
+        ("div:has-text('{t}')[role='button']", "div_button", 9),
+    )
+    _MAX_SELECTOR_PRIORITY = 9
+    
+    # Selectors probed concurrently per wave, in priority order
+    _CONCURRENT_SELECTOR_PROBES = 8
+    
+    # Background action screenshots allowed to wait for the capture lock before new ones are dropped
+    _MAX_PENDING_SCREENSHOTS = 8
+    
+    # Browser shared by engines created with reuse_browser=True
+    _shared_playwright = None
+    _shared_browser = None
+    _shared_context = None
+    
     def __init__(
         self, 
         vision_client: VisionLLMClient,
@@ -35,7 +254,11 @@ class VisionChromeEngine:
         debug_port: int = 9222,
         enable_caching: bool = True,
         performance_mode: bool = True,
-        performance_measurement_mode: bool = False
+        performance_measurement_mode: bool = False,
+        debug: bool = False,
+        visual_pause_seconds: Optional[float] = None,
+        reuse_browser: bool = False,
+        console_logging: bool = False
     ):
         """
         Initialize the Vision-Enhanced Chrome Engine.
@@ -47,6 +270,12 @@ class VisionChromeEngine:
             use_vision_primary: Whether to use vision as primary detection method
             connect_to_existing: Whether to connect to existing Chrome instance (default: True)
             debug_port: Chrome remote debugging port (default: 9222)
+            debug: Print verbose detection diagnostics (default: False)
+            visual_pause_seconds: Pause after each step so results can be observed.
+                Defaults to QUANTUMQA_VISUAL_PAUSE if set, else 0 when headless and 1.5 otherwise
+            reuse_browser: Share one Playwright browser/context across engine instances;
+                cleanup() then only closes this engine's tab (see shutdown_shared_browser)
+            console_logging: Echo browser console messages (default: False)
         """
         self.config_dir = Path(config_dir) if config_dir else Path(__file__).parent.parent / "config"
         self.use_vision_primary = use_vision_primary
@@ -55,12 +284,25 @@ class VisionChromeEngine:
         self.enable_caching = enable_caching
         self.performance_mode = performance_mode
         self.performance_measurement_mode = performance_measurement_mode
+        self.debug = debug
+        self.visual_pause_seconds = visual_pause_seconds
+        self.reuse_browser = reuse_browser
+        self.console_logging = console_logging
         
         # 🚀 PERFORMANCE: Set up cache directories
         self.cache_dir = Path.home() / ".quantumqa_cache"
         self.user_data_dir = self.cache_dir / "user_data"
+        # Cookies/localStorage snapshot for runs that cannot open the locked profile
+        self.storage_state_file = self.cache_dir / "storage_state.json"
         self.cache_dir.mkdir(exist_ok=True)
         self.user_data_dir.mkdir(exist_ok=True)
+        
+        # Output directories, created once instead of before every screenshot
+        self.results_dir = Path("test_results")
+        self.steps_dir = self.results_dir / "steps"
+        self.actions_dir = self.results_dir / "actions"
+        for output_dir in (self.steps_dir, self.actions_dir, Path("reports")):
+            output_dir.mkdir(parents=True, exist_ok=True)
 
         # Handle credentials file path
         self.credentials_file = None
@@ -79,7 +321,9 @@ class VisionChromeEngine:
         self.vision_client = vision_client
         self.element_detector = ElementDetectorAgent(
             agent_id="vision_detector",
-            vision_client=vision_client
+            vision_client=vision_client,
+            debug=debug,
+            cache_file=self.cache_dir / "vision_detection_cache.json" if enable_caching else None
         )
         
         # UI Context Management
@@ -87,7 +331,6 @@ class VisionChromeEngine:
         
         # Fallback to traditional finder if needed
         if not use_vision_primary:
-            from ..finders.element_finder import ElementFinder
             self.traditional_finder = ElementFinder(self.config_dir)
         else:
             self.traditional_finder = None
@@ -123,6 +366,56 @@ class VisionChromeEngine:
         # 🎬 GIF Creation: Initialize screenshot accumulator
         self.gif_creator = GifCreator()
         self._current_step = 0
+        self._step_timestamp = int(time.time())  # Stamped into action screenshot names
+        
+        # AI instruction normalization results by "action:host:target", persisted across runs
+        self.normalization_cache_file = self.cache_dir / "normalization_cache.json" if enable_caching else None
+        self._normalization_cache: Dict[str, List[str]] = {}
+        self._normalization_cache_dirty = False
+        
+        # Viewport size used to validate coordinates (refreshed with each analysis screenshot)
+        self._current_viewport: Optional[Dict[str, Any]] = None
+        
+        # Coordinates found on the most recent analysis screenshot, by (action, target, scope)
+        self._last_shot_hash = None
+        self._last_shot_targets: Dict[tuple, Coordinates] = {}
+        
+        # (url, page visual version), path and capture time of the last analysis screenshot, reused while unchanged
+        self._last_analysis_shot: Optional[tuple] = None
+        
+        # Path and encoded bytes of the last analysis capture, so hashing and detection skip re-reading it
+        self._last_analysis_image: Optional[tuple] = None
+        
+        # Coordinates found on earlier, perceptually similar screenshots, persisted across runs:
+        # "action|page|viewport|target|scope" -> [[ahash, x, y, element signature], ...]
+        self.similar_shot_cache_file = self.cache_dir / "similar_shot_cache.json" if enable_caching else None
+        self._similar_shot_cache: Dict[str, List[list]] = {}
+        self._similar_shot_cache_dirty = False
+        
+        # Stable selectors learned from detected elements, persisted across runs:
+        # "action|host|target|scope" -> [selector, hits, consecutive misses, element signature]
+        self.learned_selectors_file = self.cache_dir / "learned_selectors.json" if enable_caching else None
+        self._learned_selectors: Dict[str, list] = {}
+        self._learned_selectors_dirty = False
+        
+        # Page title and viewport info for the current document, dropped on every navigation
+        self._page_meta: Dict[str, Any] = {}
+        
+        # Action screenshots written in the background; awaited before reporting and cleanup.
+        # The lock is created in initialize() so it belongs to the running event loop
+        self._screenshot_tasks: List[asyncio.Task] = []
+        self._screenshot_lock: Optional[asyncio.Lock] = None
+        
+        # CDP session for the current page's action captures; False once CDP proved unavailable
+        self._cdp_session = None
+        
+        # CDP sessions holding blocked tracker URLs for the current page and its popups (performance mode),
+        # and the context whose new pages get the same filter
+        self._blocking_sessions: Dict[Any, Any] = {}
+        self._filtered_context = None
+        
+        # Credentials flattened to "service.key" -> value, loaded on the first reference
+        self._credential_values: Optional[Dict[str, Any]] = None
         
         cache_status = "enabled" if enable_caching else "disabled"
         perf_status = "enabled" if performance_mode else "disabled"
@@ -137,8 +430,44 @@ class VisionChromeEngine:
         """Initialize browser and vision components."""
         print("🚀 Initializing Vision-Enhanced Chrome Engine...")
         
-        # Initialize element detector
-        await self.element_detector.initialize()
+        # Resolve per-step visual pause (no point pausing when nobody is watching)
+        if self.visual_pause_seconds is None:
+            env_pause = os.getenv("QUANTUMQA_VISUAL_PAUSE")
+            if env_pause is not None:
+                try:
+                    self.visual_pause_seconds = float(env_pause)
+                except ValueError:
+                    print(f"⚠️ Ignoring invalid QUANTUMQA_VISUAL_PAUSE={env_pause!r} (expected seconds, e.g. 1.5)")
+            if self.visual_pause_seconds is None:
+                self.visual_pause_seconds = 0.0 if headless else 1.5
+        
+        self._screenshot_lock = asyncio.Lock()
+        
+        # Caches load from disk in worker threads while the browser starts
+        await asyncio.gather(
+            self._initialize_vision_components(),
+            self._open_browser(headless, viewport)
+        )
+        
+        print("✅ Vision-Enhanced Chrome Engine initialized")
+    
+    async def _initialize_vision_components(self) -> None:
+        """Initialize the element detector and load the normalization and similar-screenshot caches."""
+        await asyncio.gather(
+            self.element_detector.initialize(),
+            asyncio.to_thread(self._load_normalization_cache),
+            asyncio.to_thread(self._load_similar_shot_cache),
+            asyncio.to_thread(self._load_learned_selectors)
+        )
+    
+    async def _open_browser(self, headless: bool, viewport: Optional[Dict[str, int]]) -> None:
+        """Attach to a shared, existing or newly launched browser and prepare the test page."""
+        # ♻️ POOLING: Open a new tab in the shared browser if one is already running
+        if self.reuse_browser and await self._attach_shared_browser():
+            print("♻️ Reusing shared browser - opened new tab")
+            await self._configure_page()
+            await self._analyze_natural_viewport()
+            return
         
         # Initialize browser
         self.playwright = await async_playwright().start()
@@ -169,24 +498,29 @@ class VisionChromeEngine:
                 if contexts:
                     print(f"📱 Found {len(contexts)} existing contexts")
                     
+                    # Fetch all tab titles concurrently rather than one CDP round-trip at a time
+                    all_pages = [page for context in contexts for page in context.pages]
+                    titles = dict(zip(
+                        all_pages,
+                        await asyncio.gather(*(page.title() for page in all_pages), return_exceptions=True)
+                    ))
+                    
                     # Find context with active pages (likely has user authentication)
                     best_context = None
                     for i, context in enumerate(contexts):
                         pages = context.pages
                         print(f"   Context {i}: {len(pages)} pages")
-                        if pages:
-                            # Check if any pages have been navigated (not just blank)
-                            for j, page in enumerate(pages):
-                                try:
-                                    url = page.url
-                                    title = await page.title()
-                                    print(f"     Page {j}: {title} ({url})")
-                                    if url and url != "about:blank" and url != "chrome://newtab/":
-                                        best_context = context
-                                        print(f"   🎯 Context {i} has active pages - will reuse for authentication")
-                                        break
-                                except:
-                                    continue
+                        # Check if any pages have been navigated (not just blank)
+                        for j, page in enumerate(pages):
+                            title = titles.get(page)
+                            if isinstance(title, Exception):
+                                continue
+                            url = page.url
+                            print(f"     Page {j}: {title} ({url})")
+                            if url and url != "about:blank" and url != "chrome://newtab/":
+                                best_context = context
+                                print(f"   🎯 Context {i} has active pages - will reuse for authentication")
+                                break
                         if best_context:
                             break
                     
@@ -212,7 +546,7 @@ class VisionChromeEngine:
                                 has_target_domain = True
                                 print(f"🔐 Found existing session on target domain: {url}")
                                 break
-                    except:
+                    except Exception:
                         pass
                     
                     if not has_target_domain:
@@ -245,13 +579,108 @@ class VisionChromeEngine:
             self._connected_to_existing = False
             await self._launch_new_browser(headless, viewport)
         
-        # Set up page monitoring
-        self.page.on("console", lambda msg: print(f"🟦 Console: {msg.text}"))
+        # Only share browsers we launched ourselves; an attached user Chrome stays theirs
+        if self.reuse_browser and not self._connected_to_existing:
+            cls = type(self)
+            cls._shared_playwright = self.playwright
+            cls._shared_browser = self.browser
+            cls._shared_context = self.context
+        
+        await self._configure_page()
         
         # 📏 ANALYZE NATURAL VIEWPORT (NO FORCED CHANGES)
         await self._analyze_natural_viewport()
+    
+    async def _configure_page(self) -> None:
+        """Attach per-page listeners and JS helpers to the current page."""
+        # Set up page monitoring (chatty SPAs can emit hundreds of console messages)
+        if self.console_logging:
+            self.page.on("console", lambda msg: print(f"🟦 Console: {msg.text}"))
+        
+        # Title/viewport lookups are served from cache until the main frame navigates
+        self._page_meta.clear()
+        self._last_analysis_shot = None
+        self._cdp_session = None
+        self.page.on("framenavigated", self._on_frame_navigated)
+        
+        # 🚀 PERFORMANCE: Block trackers in browsers we launched (skip in measurement mode)
+        if self.performance_mode and not self.performance_measurement_mode and not self._connected_to_existing:
+            await self._setup_resource_filtering()
         
-        print("✅ Vision-Enhanced Chrome Engine initialized")
+        # Install helpers for future documents and the one already loaded
+        await self.page.add_init_script(JS_HELPERS)
+        await self.page.evaluate(JS_HELPERS)
+    
+    def _on_frame_navigated(self, frame) -> None:
+        """Invalidate cached page metadata and reusable coordinates when the main frame navigates."""
+        if frame == self.page.main_frame:
+            self._page_meta.clear()
+            # A new document can look identical while its elements are not wired up yet
+            self._last_shot_hash = None
+            self._last_shot_targets = {}
+            self._last_analysis_shot = None
+    
+    async def _page_title(self, refresh: bool = False) -> str:
+        """
+        Current page title, fetched once per navigation.
+        
+        Args:
+            refresh: Read the live title (e.g. after an action) and update the cached one
+        """
+        if refresh or "title" not in self._page_meta:
+            self._page_meta["title"] = await self.page.title()
+        return self._page_meta["title"]
+    
+    async def _attach_shared_browser(self) -> bool:
+        """Open a new tab in the shared browser context; False if there is none usable."""
+        cls = type(self)
+        if cls._shared_context is None:
+            return False
+        
+        try:
+            page = await cls._shared_context.new_page()
+        except Exception as e:
+            print(f"⚠️ Shared browser no longer usable, launching a new one: {e}")
+            cls._shared_playwright = cls._shared_browser = cls._shared_context = None
+            return False
+        
+        self.playwright = cls._shared_playwright
+        self.browser = cls._shared_browser
+        self.context = cls._shared_context
+        self.page = page
+        self._connected_to_existing = False
+        self.page.set_default_timeout(15000)
+        self.page.set_default_navigation_timeout(20000)
+        return True
+    
+    async def reset_page(self) -> None:
+        """Replace the current tab with a fresh one in the same browser context."""
+        if self.page and not self.page.is_closed():
+            await self.page.close()
+        
+        self.page = await self.context.new_page()
+        self.page.set_default_timeout(15000)
+        self.page.set_default_navigation_timeout(20000)
+        await self._configure_page()
+        self.ui_context_manager.clear_all_contexts()
+        await self._analyze_natural_viewport()
+        print("📄 Opened fresh tab in existing browser context")
+    
+    @classmethod
+    async def shutdown_shared_browser(cls) -> None:
+        """Close the browser shared by reuse_browser engines."""
+        try:
+            if cls._shared_context:
+                await cls._shared_context.close()
+            if cls._shared_browser:
+                await cls._shared_browser.close()
+            if cls._shared_playwright:
+                await cls._shared_playwright.stop()
+            print("✅ Shared browser closed")
+        except Exception as e:
+            print(f"⚠️ Shared browser shutdown warning: {e}")
+        finally:
+            cls._shared_playwright = cls._shared_browser = cls._shared_context = None
     
     async def _launch_new_browser(self, headless: bool = False, viewport: Dict[str, int] = None) -> None:
         """Launch a new Chrome browser instance with caching and performance optimizations."""
@@ -335,14 +764,27 @@ class VisionChromeEngine:
         try:
             if self.enable_caching:
                 # Use persistent context per Playwright guidance
-                self.context = await self.playwright.chromium.launch_persistent_context(
-                    user_data_dir=str(self.user_data_dir),
-                    channel="chrome",
-                    headless=headless,
-                    args=chrome_args,
-                    **context_options
-                )
-                self.browser = self.context.browser
+                try:
+                    self.context = await self.playwright.chromium.launch_persistent_context(
+                        user_data_dir=str(self.user_data_dir),
+                        channel="chrome",
+                        headless=headless,
+                        args=chrome_args,
+                        **context_options
+                    )
+                    self.browser = self.context.browser
+                except Exception as e:
+                    if not PROFILE_IN_USE_PATTERN.search(str(e)):
+                        raise
+                    # Another run holds the profile: start from its last saved cookies/storage instead
+                    print("    🔒 Persistent profile in use by another run - using saved storage state")
+                    self.browser = await self.playwright.chromium.launch(
+                        channel="chrome",
+                        headless=headless,
+                        args=chrome_args
+                    )
+                    storage_state = str(self.storage_state_file) if self.storage_state_file.exists() else None
+                    self.context = await self.browser.new_context(storage_state=storage_state, **context_options)
             else:
                 # Fallback to regular launch + ephemeral context
                 self.browser = await self.playwright.chromium.launch(
@@ -403,17 +845,14 @@ class VisionChromeEngine:
         self.page.set_default_timeout(15000)  # Reduced from 30s default
         self.page.set_default_navigation_timeout(20000)  # Reduced navigation timeout
         
-        # 🚀 PERFORMANCE: Optional resource filtering (skip in measurement mode)
-        if self.performance_mode and not self.performance_measurement_mode:
-            await self._setup_resource_filtering()
-        elif self.performance_measurement_mode:
+        # 🚀 PERFORMANCE: Resource filtering is applied per page in _configure_page
+        if self.performance_measurement_mode:
             print(f"    🎯 Skipping resource filtering for accurate performance measurement")
     
     async def execute_test(self, instruction_file: str) -> Dict[str, Any]:
         """Execute test instructions using vision-enhanced detection."""
-        import time
-        
-        instructions = self._load_instructions(instruction_file)
+        # File I/O off the event loop so Playwright's connection keeps being serviced
+        instructions = await asyncio.to_thread(self._load_instructions, instruction_file)
         print(f"📋 Loaded {len(instructions)} instructions")
         
         results = []
@@ -426,26 +865,30 @@ class VisionChromeEngine:
         # Clear any previous UI contexts for new test
         self.ui_context_manager.clear_all_contexts()
         
+        # Parse every step up front so no step waits on the parser; the cost is shared out per step
+        batch_parse_start = time.time()
+        parsed_plans = await self.instruction_parser.parse_batch(instructions)
+        step_parse_time = (time.time() - batch_parse_start) / max(total_steps, 1)
+        
         for i, instruction in enumerate(instructions, 1):
             step_start_time = time.time()
             print(f"\n📍 Step {i}/{total_steps}: {instruction}")
             
             # Track current step for screenshots
             self._current_step = i
+            self._step_timestamp = int(step_start_time)
             
             try:
                 # 🎬 Take step screenshot for GIF
                 await self._take_step_screenshot(i)
-                # Analyze step for UI context creation (dropdowns, modals, etc.)
-                ui_context_created = self.ui_context_manager.analyze_step_for_context(i, instruction)
-                
-                # Check if step needs to be executed within a specific UI context
-                ui_context_needed = self.ui_context_manager.check_if_step_needs_context(i, instruction)
+                # Analyze step for UI context creation (dropdowns, modals, etc.) and
+                # check if it needs to be executed within a specific UI context
+                ui_context_created, ui_context_needed = self.ui_context_manager.analyze_and_check(i, instruction)
                 
-                # Parse instruction
+                # Parsed up front; a step that failed to parse is re-parsed here so its error is reported
                 parse_start = time.time()
-                action_plan = await self.instruction_parser.parse(instruction)
-                parse_time = time.time() - parse_start
+                action_plan = parsed_plans[i - 1] or await self.instruction_parser.parse(instruction)
+                parse_time = step_parse_time + (time.time() - parse_start)
                 print(f"  🔍 Parsed as: {action_plan['action']} -> {action_plan.get('target', 'N/A')} ({parse_time:.2f}s)")
                 
                 # Skip comment lines and empty instructions
@@ -460,7 +903,7 @@ class VisionChromeEngine:
                         "success": True,
                         "skipped": True,
                         "url": self.page.url,
-                        "title": await self.page.title(),
+                        "title": await self._page_title(),
                         "timing": {
                             "parse_time": parse_time,
                             "execute_time": 0.0,
@@ -470,16 +913,12 @@ class VisionChromeEngine:
                     continue
                 
                 # 🚀 SMART LOADING: Look ahead for next action target to optimize page loading
-                if action_plan["action"] == "navigate" and i + 1 < total_steps:
-                    next_instruction = instructions[i + 1].strip()
-                    if next_instruction and not next_instruction.startswith('#') and not next_instruction.startswith('//'):
-                        try:
-                            next_action_plan = await self.instruction_parser.parse(next_instruction)
-                            if next_action_plan.get("target"):
-                                action_plan["next_action_target"] = next_action_plan["target"]
-                                print(f"    🎯 Next action target identified: '{next_action_plan['target']}'")
-                        except:
-                            pass  # Ignore parsing errors for lookahead
+                # (steps are 1-based, so parsed_plans[i] is the next step; comments have no target)
+                if action_plan["action"] == "navigate" and i < total_steps:
+                    next_action_plan = parsed_plans[i]
+                    if next_action_plan and next_action_plan.get("target"):
+                        action_plan["next_action_target"] = next_action_plan["target"]
+                        print(f"    🎯 Next action target identified: '{next_action_plan['target']}'")
                 
                 # Add UI context information to action plan if needed
                 if ui_context_needed:
@@ -519,7 +958,8 @@ class VisionChromeEngine:
                     "status": "success" if success else "failed",
                     "success": success,  # Add boolean success field for report processing
                     "url": self.page.url,
-                    "title": await self.page.title(),
+                    # Clicks and navigations already re-read the title; navigation invalidates it
+                    "title": await self._page_title(),
                     "timing": {
                         "parse_time": parse_time,
                         "execute_time": execute_time,
@@ -535,8 +975,9 @@ class VisionChromeEngine:
                     print(f"  ❌ Step {i + 1} failed ({step_total_time:.2f}s total)")
                 
                 # 🎯 VISUAL FEEDBACK: Brief pause to observe result
-                print(f"  ⏸️ Pausing to observe step result...")
-                await asyncio.sleep(1.5)  # Slightly longer pause for visual confirmation
+                if self.visual_pause_seconds:
+                    print(f"  ⏸️ Pausing to observe step result...")
+                    await asyncio.sleep(self.visual_pause_seconds)
                 
             except Exception as e:
                 step_total_time = time.time() - step_start_time
@@ -550,7 +991,7 @@ class VisionChromeEngine:
                     "success": False,  # Add boolean success field for report processing
                     "error": str(e),
                     "url": self.page.url,
-                    "title": await self.page.title(),
+                    "title": await self._page_title(),
                     "timing": {
                         "parse_time": 0.0,
                         "execute_time": 0.0,
@@ -575,7 +1016,6 @@ class VisionChromeEngine:
                 print(f"    🧭 Navigating to: {url}")
                 
                 # Capture pre-navigation state
-                initial_url = self.page.url
                 await self._capture_action_screenshot("pre_navigation")
                 
                 # Perform navigation
@@ -587,19 +1027,27 @@ class VisionChromeEngine:
                     next_action_target = action_plan.get("next_action_target")
                     await self._wait_for_page_stability(navigation=True, target_hint=next_action_target)
                     
-                    # Capture post-navigation state
-                    await self._capture_action_screenshot("post_navigation")
+                    # Capture post-navigation state and read the title concurrently
+                    _, final_title = await asyncio.gather(
+                        self._capture_action_screenshot("post_navigation"),
+                        self._page_title(refresh=True)
+                    )
                     
                     # Show navigation result
                     final_url = self.page.url
-                    final_title = await self.page.title()
-                    print(f"    ✅ Navigation successful")
-                    print(f"    🌐 Current URL: {final_url}")
-                    print(f"    📄 Page title: {final_title}")
+                    print(
+                        f"    ✅ Navigation successful\n"
+                        f"    🌐 Current URL: {final_url}\n"
+                        f"    📄 Page title: {final_title}"
+                    )
                 
                 return success
                 
             elif action in ["click", "type"]:
+                # ⚡ FAST PATH: Explicit selectors need no detection at all
+                if action_plan.get("selector") and await self._act_on_selector(action_plan):
+                    return True
+                
                 # Use vision-based element detection
                 element_coords = await self._find_element_with_vision(action_plan, step_number)
                 
@@ -611,8 +1059,10 @@ class VisionChromeEngine:
                         print(f"    🖱️➡️⌨️ {'Combined' if action_plan.get('combined_action') else 'Standard'} action: clicking then typing")
                         click_success = await self._click_at_coordinates(element_coords)
                         if click_success:
-                            # Add slight delay to ensure focus is set
-                            await asyncio.sleep(0.3)
+                            # The click's mousedown moves focus synchronously, and the click already
+                            # waited for the page to react; the pause only helps someone watching
+                            if self.visual_pause_seconds:
+                                await asyncio.sleep(0.3)
                             return await self._type_text(action_plan["text"])
                         return False
                 else:
@@ -685,56 +1135,25 @@ class VisionChromeEngine:
         print(f"    🔍 Analyzing unknown instruction: '{raw_instruction}'")
         
         # 🧠 INTELLIGENT ACTION INFERENCE
-        # Infer the most likely action type from the instruction text
-        inferred_action = None
-        target_element = None
-        
-        # Look for action keywords in the instruction
-        if any(keyword in raw_instruction for keyword in ['look for', 'find', 'locate', 'search for']):
-            inferred_action = 'verify'
-            # Extract what we're looking for
-            if 'look for' in raw_instruction:
-                target_element = raw_instruction.split('look for')[1].strip()
-            elif 'find' in raw_instruction:
-                target_element = raw_instruction.split('find')[1].strip()
-            elif 'locate' in raw_instruction:
-                target_element = raw_instruction.split('locate')[1].strip()
-            elif 'search for' in raw_instruction:
-                target_element = raw_instruction.split('search for')[1].strip()
-                
-        elif any(keyword in raw_instruction for keyword in ['click', 'tap', 'press', 'select']):
-            inferred_action = 'click'
-            # Extract click target
-            for keyword in ['click', 'tap', 'press', 'select']:
-                if keyword in raw_instruction:
-                    parts = raw_instruction.split(keyword, 1)
-                    if len(parts) > 1:
-                        target_element = parts[1].strip()
-                    break
-                    
-        elif any(keyword in raw_instruction for keyword in ['type', 'enter', 'input']):
-            inferred_action = 'type'
-            # Extract text and field (this is complex, fall back to verification for now)
-            target_element = raw_instruction
-            
-        elif any(keyword in raw_instruction for keyword in ['verify', 'check', 'ensure', 'confirm']):
-            inferred_action = 'verify'
-            target_element = raw_instruction
-            
-        else:
-            # Default to verification for unknown instructions
-            inferred_action = 'verify'
-            target_element = raw_instruction
+        # Infer the most likely action type from the instruction text; default to verification
+        inferred_action = 'verify'
+        target_element = raw_instruction
+        
+        # One regex search per keyword family; the target is whatever follows the first keyword
+        # (typing targets are complex to extract, so those keep the whole instruction for now)
+        for action, pattern, target_follows in INFERRED_ACTION_PATTERNS:
+            match = pattern.search(raw_instruction)
+            if match:
+                inferred_action = action
+                if target_follows:
+                    target_element = raw_instruction[match.end():].strip()
+                break
         
         if not target_element:
             target_element = raw_instruction
             
-        # Clean up target element text
-        target_element = target_element.strip()
-        # Remove common words that might interfere
-        for word in ['that', 'the', 'is', 'are', 'should', 'be', 'in', 'on', 'at']:
-            if target_element.startswith(word + ' '):
-                target_element = target_element[len(word):].strip()
+        # Clean up target element text, removing leading words that might interfere
+        target_element = LEADING_FILLER_PATTERN.sub('', target_element.strip())
                 
         # 🎯 SMART INPUT FIELD DETECTION
         # Convert generic input field descriptions to actual UI patterns
@@ -776,6 +1195,19 @@ class VisionChromeEngine:
             print(f"    ❌ Could not infer how to execute: '{raw_instruction}'")
             return False
     
+    async def _act_on_selector(self, action_plan: Dict[str, Any]) -> bool:
+        """Click (and type into) the element matched by an explicit selector; False to fall back."""
+        selector = action_plan["selector"]
+        try:
+            print(f"    ⚡ Using explicit selector: {selector}")
+            await self.page.locator(selector).first.click(timeout=2000)
+            if action_plan["action"] == "type":
+                return await self._type_text(action_plan["text"])
+            return True
+        except Exception as e:
+            print(f"    ⚠️ Explicit selector failed, falling back to detection: {e}")
+            return False
+    
     async def _verify_element_with_vision(self, element_description: str, step_number: int) -> bool:
         """Use vision to verify an element exists and is visible."""
         
@@ -790,7 +1222,7 @@ class VisionChromeEngine:
         try:
             context = {
                 "url": self.page.url,
-                "title": await self.page.title(),
+                "title": await self._page_title(),
                 "action_type": "verify",
                 "verification_purpose": "element_visibility"
             }
@@ -800,7 +1232,8 @@ class VisionChromeEngine:
             detection_result = await self.element_detector.detect_element(
                 screenshot_path=screenshot_path,
                 instruction=instruction,
-                context=context
+                context=context,
+                screenshot_bytes=self._analysis_image(screenshot_path)
             )
             
             if detection_result.found and detection_result.center_coordinates:
@@ -828,34 +1261,215 @@ class VisionChromeEngine:
             print("    ⚠️ No target element specified for vision detection")
             return None
             
-        print(f"    🔍 VISION DEBUG: Looking for target: '{target}'")
-        print(f"    🔍 VISION DEBUG: Raw instruction: '{action_plan.get('raw_instruction', '')}'")
-        print(f"    🔍 VISION DEBUG: Action plan keys: {list(action_plan.keys())}")
+        if self.debug:
+            print(f"    🔍 VISION DEBUG: Looking for target: '{target}'")
+            print(f"    🔍 VISION DEBUG: Raw instruction: '{action_plan.get('raw_instruction', '')}'")
+            print(f"    🔍 VISION DEBUG: Action plan keys: {list(action_plan.keys())}")
+        
+        # ♻️ DEDUP: Reuse coordinates found on an identical screenshot (page unchanged)
+        image = self._analysis_image(screenshot_path)
+        shot_hash = bytes_digest(image) if image is not None else file_digest(screenshot_path)
+        if shot_hash != self._last_shot_hash:
+            self._last_shot_hash = shot_hash
+            self._last_shot_targets = {}
+        target_key = (action_plan["action"], target, action_plan.get("search_scope"))
+        cached_coords = self._last_shot_targets.get(target_key)
+        if cached_coords:
+            print(f"    ♻️ Page unchanged since last analysis - reusing coordinates ({cached_coords.x}, {cached_coords.y})")
+            return cached_coords
+        
+        # 🎓 LEARNED: A stable selector found for this target before skips detection entirely
+        selector_key = self._learned_selector_key(action_plan, target)
+        coords = await self._try_learned_selector(selector_key, target, action_plan["action"])
+        if coords:
+            self._last_shot_targets[target_key] = coords
+            return coords
+        
+        # 🧬 SIMILAR: Reuse coordinates from a near-identical screenshot if the same element is still there
+        similar_key = self._similar_shot_key(action_plan, target)
+        shot_ahash = await asyncio.to_thread(image_ahash, image if image is not None else screenshot_path)
+        coords = await self._reuse_similar_shot_coordinates(similar_key, shot_ahash, action_plan["action"])
+        if coords:
+            self._last_shot_targets[target_key] = coords
+            return coords
+        
+        coords = await self._detect_element_coordinates(action_plan, target, screenshot_path, step_number)
+        if coords:
+            self._last_shot_targets[target_key] = coords
+            await asyncio.gather(
+                self._remember_similar_shot(similar_key, shot_ahash, coords, action_plan["action"]),
+                self._learn_selector(selector_key, coords, action_plan["action"])
+            )
+        return coords
+    
+    def _learned_selector_key(self, action_plan: Dict[str, Any], target: str) -> str:
+        """Key for learned selectors: action, host, target and UI scope (any page of the site)."""
+        return "|".join((
+            action_plan["action"],
+            urlparse(self.page.url).netloc,
+            target.lower(),
+            str(action_plan.get("search_scope") or "")
+        ))
+    
+    async def _try_learned_selector(self, key: str, target: str, action: str) -> Optional[Coordinates]:
+        """Locate the target through its learned selector if it still resolves to the element it was learned on."""
+        entry = self._learned_selectors.get(key)
+        if not entry:
+            return None
+        
+        selector_info = {"selector": entry[0], "strategy": "learned_selector", "priority": 0}
+        bounding_box = await self._probe_selector(selector_info)
+        coords = self._box_center(bounding_box) if bounding_box else None
+        if not coords or not self._validate_coordinates_in_viewport(coords):
+            entry[2] += 1
+            if entry[2] >= LEARNED_SELECTOR_MAX_MISSES:
+                self._forget_learned_selector(key, target)
+            self._learned_selectors_dirty = True
+            return None
+        
+        # Keys span every page of the site: the selector may now match something else entirely.
+        # Entries saved without a signature cannot be checked and are dropped the same way
+        if len(entry) < 4 or await self._element_signature(coords, action) != entry[3]:
+            self._forget_learned_selector(key, target)
+            return None
+        
+        entry[1] += 1
+        entry[2] = 0
+        self._learned_selectors_dirty = True
+        return self._selector_hit(target, selector_info, bounding_box)
+    
+    def _forget_learned_selector(self, key: str, target: str) -> None:
+        """Drop a learned selector; detection finds the target again and may learn a new one."""
+        entry = self._learned_selectors.pop(key)
+        self._learned_selectors_dirty = True
+        if self.debug:
+            print(f"    🎓 Forgot learned selector for '{target}': {entry[0]}")
+    
+    async def _learn_selector(self, key: str, coordinates: Coordinates, action: str) -> None:
+        """Remember a unique, stable-attribute selector for the interactive element found at the coordinates."""
+        try:
+            selector = await self.page.evaluate(
+                "([x, y]) => window.__qq_stableSelectorAt(x, y)", [coordinates.x, coordinates.y]
+            )
+        except Exception:
+            return
+        if not selector:
+            return
+        
+        # Sign the element where a later lookup will land (its center), not the detected point
+        selector_info = {"selector": selector, "strategy": "learned_selector", "priority": 0}
+        bounding_box = await self._probe_selector(selector_info)
+        if not bounding_box:
+            return
+        signature = await self._element_signature(self._box_center(bounding_box), action)
+        if not signature:
+            return
+        
+        entry = self._learned_selectors.get(key)
+        if entry and entry[0] == selector and entry[3:] == [signature]:
+            return
+        self._learned_selectors[key] = [selector, 0, 0, signature]
+        self._learned_selectors_dirty = True
+        if self.debug:
+            print(f"    🎓 Learned selector {selector}")
+    
+    def _similar_shot_key(self, action_plan: Dict[str, Any], target: str) -> str:
+        """Key for the similar-screenshot cache: action, page (host + path), viewport and target."""
+        parsed = urlparse(self.page.url)
+        viewport = self._current_viewport or {}
+        return "|".join((
+            action_plan["action"],
+            f"{parsed.netloc}{parsed.path}",
+            f"{viewport.get('width')}x{viewport.get('height')}",
+            target.lower(),
+            str(action_plan.get("search_scope") or "")
+        ))
+    
+    async def _element_signature(self, coordinates: Coordinates, action: str) -> Optional[str]:
+        """Digest of the interactive element at the coordinates, or None if nothing usable is there."""
+        try:
+            element = await self.page.evaluate(
+                "({x, y, action}) => window.__qq_isInteractiveAt(x, y, action) ? window.__qq_describeAt(x, y).element : null",
+                {"x": coordinates.x, "y": coordinates.y, "action": action}
+            )
+        except Exception:
+            return None
+        if not element:
+            return None
+        return text_digest(json.dumps([element.get(field) for field in ELEMENT_SIGNATURE_FIELDS]))
+    
+    async def _reuse_similar_shot_coordinates(self, key: str, shot_ahash: int, action: str) -> Optional[Coordinates]:
+        """Return remembered coordinates whose screenshot looks alike and still point at the same element."""
+        entries = self._similar_shot_cache.get(key)
+        if not entries:
+            return None
+        
+        # Closest screenshot first; entries too far apart are a different page state
+        candidates = sorted(
+            (hamming_distance(shot_ahash, entry[0]), entry) for entry in entries
+        )
+        for distance, (_, x, y, signature) in candidates:
+            if distance > SIMILAR_SHOT_MAX_DISTANCE:
+                break
+            coords = Coordinates(x=x, y=y)
+            if not self._validate_coordinates_in_viewport(coords):
+                continue
+            if await self._element_signature(coords, action) == signature:
+                print(f"    🧬 Similar screenshot seen before ({distance} bits apart) - reusing coordinates ({x}, {y})")
+                return coords
+        return None
+    
+    async def _remember_similar_shot(self, key: str, shot_ahash: int, coordinates: Coordinates, action: str) -> None:
+        """Remember detected coordinates with the screenshot hash and a signature of the element there."""
+        signature = await self._element_signature(coordinates, action)
+        if not signature:
+            return
+        
+        entries = [
+            entry for entry in self._similar_shot_cache.pop(key, [])
+            if entry[0] != shot_ahash
+        ]
+        entries.append([shot_ahash, coordinates.x, coordinates.y, signature])
+        # Re-inserting keeps the dict ordered oldest to newest for trimming on save
+        self._similar_shot_cache[key] = entries[-SIMILAR_SHOT_ENTRIES_PER_TARGET:]
+        self._similar_shot_cache_dirty = True
+    
+    async def _detect_element_coordinates(
+        self,
+        action_plan: Dict[str, Any],
+        target: str,
+        screenshot_path: str,
+        step_number: int
+    ) -> Optional[Coordinates]:
+        """Run normalization, traditional and vision detection for a target on a screenshot."""
+        
+        action_type = action_plan["action"]
         
         # Create context for better detection
         context = {
             "url": self.page.url,
-            "title": await self.page.title(),
-            "action_type": action_plan["action"],
+            "title": await self._page_title(),
+            "action_type": action_type,
             "previous_action": "navigation" if step_number == 1 else "user_action"
         }
         
         # Add UI context information if available
-        ui_context_fields = ["ui_context_type", "ui_context_target", "ui_context_opened_step", "search_scope", "context_keywords"]
-        for field in ui_context_fields:
-            if field in action_plan:
-                context[field] = action_plan[field]
+        for field in UI_CONTEXT_FIELDS:
+            value = action_plan.get(field)
+            if value is not None:
+                context[field] = value
         
         # 🧠 INTELLIGENT THREE-STAGE PIPELINE
         print(f"    🧠 Using intelligent detection pipeline for: '{target}'")
         
         try:
             # Stage 1: AI-Powered Instruction Normalization (Fast & Cheap)
-            normalized_targets = await self._normalize_instruction_with_ai(action_plan, target)
+            normalized_targets = await self._normalize_instruction_with_ai(action_plan, target, page_context=context)
             print(f"    🤖 AI normalized '{target}' → {normalized_targets}")
             
             # Stage 2: Enhanced Traditional Detection with normalized terms
-            print(f"    🔍 TRADITIONAL DEBUG: Trying enhanced traditional detection with target='{target}' and normalized={normalized_targets}")
+            if self.debug:
+                print(f"    🔍 TRADITIONAL DEBUG: Trying enhanced traditional detection with target='{target}' and normalized={normalized_targets}")
             traditional_coords = await self._try_enhanced_traditional_detection(action_plan, target, normalized_targets)
             if traditional_coords:
                 # Validate coordinates are within viewport bounds
@@ -864,7 +1478,7 @@ class VisionChromeEngine:
                     return traditional_coords
                 else:
                     print(f"    ⚠️ Traditional detection found element outside viewport bounds at ({traditional_coords.x}, {traditional_coords.y})")
-            else:
+            elif self.debug:
                 print(f"    ❌ TRADITIONAL DEBUG: Enhanced traditional detection returned None")
             
             # Stage 3: Fall back to vision detection if both AI+traditional fail
@@ -872,27 +1486,27 @@ class VisionChromeEngine:
             self.vision_detections += 1
             
             # Enhanced instruction for better detection
-            action_type = action_plan["action"]
             enhanced_instruction = f"Find the interactive {target} element that can be {action_type}ed. Look for input fields, buttons, or clickable elements, NOT decorative divs or styling elements."
             
             detection_result = await self.element_detector.detect_element(
                 screenshot_path=screenshot_path,
                 instruction=enhanced_instruction,
-                context=context
+                context=context,
+                screenshot_bytes=self._analysis_image(screenshot_path)
             )
             
             if detection_result.found and detection_result.center_coordinates:
                 # ✅ VALIDATE ELEMENT IS INTERACTIVE AND WITHIN VIEWPORT
                 coords = detection_result.center_coordinates
-                print(f"    🔍 VISION DEBUG: Vision AI found element at coordinates ({coords.x}, {coords.y})")
-                print(f"    🔍 VISION DEBUG: Detection confidence: {detection_result.confidence if hasattr(detection_result, 'confidence') else 'N/A'}")
+                if self.debug:
+                    print(f"    🔍 VISION DEBUG: Vision AI found element at coordinates ({coords.x}, {coords.y})")
+                    print(f"    🔍 VISION DEBUG: Detection confidence: {detection_result.confidence}")
                 
                 # First check if coordinates are within viewport bounds
                 if not self._validate_coordinates_in_viewport(coords):
                     print(f"    ⚠️ Vision found element outside viewport bounds at ({coords.x}, {coords.y}) - retrying...")
-                    better_coords = await self._find_nearby_interactive_element(coords, action_plan["action"])
+                    better_coords = await self._find_nearby_interactive_element(coords, action_type)
                     if better_coords and self._validate_coordinates_in_viewport(better_coords):
-                        print(f"    🔍 VISION DEBUG: Found better coordinates at ({better_coords.x}, {better_coords.y})")
                         coords = better_coords
                         print(f"    ✅ Found better element within viewport at ({coords.x}, {coords.y})")
                     else:
@@ -901,7 +1515,7 @@ class VisionChromeEngine:
                         return None
                 
                 # Then check if element is interactive
-                is_interactive = await self._validate_interactive_element(coords, action_plan["action"])
+                is_interactive = await self._validate_interactive_element(coords, action_type)
                 
                 if is_interactive:
                     print(f"    ✅ Vision found interactive element at ({coords.x}, {coords.y}) confidence={detection_result.confidence:.2f}")
@@ -909,7 +1523,7 @@ class VisionChromeEngine:
                 else:
                     print(f"    ⚠️ Vision found non-interactive element at ({coords.x}, {coords.y}) - retrying...")
                     # Try to find a better element nearby
-                    better_coords = await self._find_nearby_interactive_element(coords, action_plan["action"])
+                    better_coords = await self._find_nearby_interactive_element(coords, action_type)
                     if better_coords and self._validate_coordinates_in_viewport(better_coords):
                         print(f"    ✅ Found better interactive element at ({better_coords.x}, {better_coords.y})")
                         return better_coords
@@ -930,36 +1544,10 @@ class VisionChromeEngine:
     async def _validate_interactive_element(self, coordinates: Coordinates, action: str) -> bool:
         """Validate that element at coordinates is actually interactive."""
         try:
-            element_info = await self.page.evaluate(f"""
-                (() => {{
-                    const element = document.elementFromPoint({coordinates.x}, {coordinates.y});
-                    if (!element) return false;
-                    
-                    const tag = element.tagName.toLowerCase();
-                    const type = element.type || '';
-                    const role = element.getAttribute('role') || '';
-                    
-                    // Check if element is interactive based on action type
-                    if ('{action}' === 'click') {{
-                        return tag === 'button' || 
-                               tag === 'a' ||
-                               tag === 'input' ||
-                               tag === 'select' ||
-                               tag === 'textarea' ||
-                               role === 'button' ||
-                               role === 'link' ||
-                               element.onclick !== null ||
-                               element.style.cursor === 'pointer';
-                    }}
-                    
-                    if ('{action}' === 'type') {{
-                        return tag === 'input' || tag === 'textarea' ||
-                               element.contentEditable === 'true';
-                    }}
-                    
-                    return false;
-                }})()
-            """)
+            element_info = await self.page.evaluate(
+                "({x, y, action}) => window.__qq_isInteractiveAt(x, y, action)",
+                {"x": coordinates.x, "y": coordinates.y, "action": action}
+            )
             return bool(element_info)
         except Exception:
             return False
@@ -967,98 +1555,24 @@ class VisionChromeEngine:
     async def _find_nearby_interactive_element(self, coordinates: Coordinates, action: str) -> Optional[Coordinates]:
         """Find an interactive element near the given coordinates."""
         try:
-            # For search-related actions, try semantic search first
+            # Semantic search (click only) and the expanding-circle scan run in one evaluate
             if action == 'click':
                 print(f"    🔄 Trying semantic element search first...")
-                semantic_result = await self.page.evaluate(f"""
-                    (() => {{
-                        let selectors = [
-                            'input[name="q"]',          // Google search
-                            'input[type="search"]',      // Search inputs
-                            'input[placeholder*="search" i]',  // Search placeholders
-                            'input[aria-label*="search" i]',   // Search aria labels
-                            '[role="searchbox"]',        // Search role
-                            'input[name="search"]',      // Search name
-                            'textarea[name="q"]',        // Alternative search
-                            'input[name="query"]'        // Query inputs
-                        ];
-                        
-                        for (const selector of selectors) {{
-                            const element = document.querySelector(selector);
-                            if (element && element.offsetParent !== null) {{ // Check if visible
-                                const rect = element.getBoundingClientRect();
-                                return {{
-                                    x: rect.left + rect.width / 2,
-                                    y: rect.top + rect.height / 2,
-                                    tag: element.tagName.toLowerCase(),
-                                    selector: selector
-                                }};
-                            }}
-                        }}
-                        return null;
-                    }})()
-                """)
-                
-                if semantic_result:
-                    print(f"    ✅ Found element with semantic search: {semantic_result['selector']}")
-                    from ..core.models import Coordinates
-                    return Coordinates(x=int(semantic_result['x']), y=int(semantic_result['y']))
-            
-            # If semantic search doesn't find anything, try expanding circles around the original coordinates
-            for radius in [15, 30, 60, 120, 200]:
-                element_info = await self.page.evaluate(f"""
-                    (() => {{
-                        const originalX = {coordinates.x};
-                        const originalY = {coordinates.y};
-                        const radius = {radius};
-                        
-                        // Check points in a circle around the original coordinates
-                        for (let angle = 0; angle < 360; angle += 30) {{
-                            const radians = angle * Math.PI / 180;
-                            const x = originalX + radius * Math.cos(radians);
-                            const y = originalY + radius * Math.sin(radians);
-                            
-                            const element = document.elementFromPoint(x, y);
-                            if (!element) continue;
-                            
-                            const tag = element.tagName.toLowerCase();
-                            const type = element.type || '';
-                            const role = element.getAttribute('role') || '';
-                            
-                            let isInteractive = false;
-                            if ('{action}' === 'click') {{
-                                isInteractive = tag === 'button' || 
-                                               tag === 'a' ||
-                                               tag === 'input' ||
-                                               tag === 'select' ||
-                                               tag === 'textarea' ||
-                                               role === 'button' ||
-                                               role === 'link' ||
-                                               element.onclick !== null;
-                            }} else if ('{action}' === 'type') {{
-                                isInteractive = tag === 'input' || tag === 'textarea' ||
-                                               element.contentEditable === 'true';
-                            }}
-                            
-                            if (isInteractive) {{
-                                const rect = element.getBoundingClientRect();
-                                return {{
-                                    x: rect.left + rect.width / 2,
-                                    y: rect.top + rect.height / 2,
-                                    tag: tag,
-                                    id: element.id,
-                                    name: element.name
-                                }};
-                            }}
-                        }}
-                        return null;
-                    }})()
-                """)
-                
-                if element_info:
-                    print(f"    🔍 Found {element_info['tag']} at radius {radius}px (id: {element_info.get('id', 'none')}, name: {element_info.get('name', 'none')})")
-                    from ..core.models import Coordinates
-                    return Coordinates(x=int(element_info['x']), y=int(element_info['y']))
+            element_info = await self.page.evaluate("(args) => window.__qq_findNearby(args)", {
+                "x": coordinates.x,
+                "y": coordinates.y,
+                "action": action,
+                "offsets": NEARBY_SEARCH_OFFSETS,
+                "semanticSelectors": SEMANTIC_SEARCH_SELECTORS if action == 'click' else []
+            })
+            
+            if element_info and element_info['source'] == 'semantic':
+                print(f"    ✅ Found element with semantic search: {element_info['selector']}")
+                return Coordinates(int(element_info['x']), int(element_info['y']))
+            
+            if element_info:
+                print(f"    🔍 Found {element_info['tag']} at radius {element_info['radius']}px (id: {element_info.get('id') or 'none'}, name: {element_info.get('name') or 'none'})")
+                return Coordinates(int(element_info['x']), int(element_info['y']))
             
             # If we reach here, no elements found
             print(f"    ❌ No interactive elements found in search area")
@@ -1068,86 +1582,76 @@ class VisionChromeEngine:
             print(f"    ⚠️ Error in nearby element search: {e}")
             return None
     
-    async def _normalize_instruction_with_ai(self, action_plan: Dict[str, Any], target: str) -> List[str]:
-        """Use AI to normalize human language instructions into selector-friendly terms."""
+    async def _normalize_instruction_with_ai(
+        self,
+        action_plan: Dict[str, Any],
+        target: str,
+        page_context: Optional[Dict[str, Any]] = None
+    ) -> List[str]:
+        """
+        Use AI to normalize human language instructions into selector-friendly terms.
+        
+        Args:
+            page_context: Already-fetched page "url"/"title" to avoid another round-trip
+        """
+        # ⚡ Common single-word targets gain nothing from an AI round-trip
+        if self._should_skip_ai(target):
+            print(f"    ⚡ Using basic normalization for common term '{target}'")
+            return self._basic_normalization(target)
+        
+        # ♻️ CACHE: Normalized terms depend only on the action, target and site
+        cache_key = f"{action_plan['action']}:{urlparse(self.page.url).netloc}:{target}"
+        cached_terms = self._normalization_cache.pop(cache_key, None)
+        if cached_terms:
+            # Re-insert as most recently used, so saving trims the least recently used entries
+            self._normalization_cache[cache_key] = cached_terms
+            self._normalization_cache_dirty = True
+            print(f"    ♻️ Using cached normalization for '{target}'")
+            return list(cached_terms)
+        
         try:
-            # Define stop words that should be filtered out
-            STOP_WORDS = {
-                'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
-                'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
-                'to', 'was', 'were', 'will', 'with', 'would', 'this', 'these',
-                'those', 'they', 'there', 'their', 'then', 'than', 'them', 'can',
-                'could', 'should', 'would', 'may', 'might', 'must', 'shall', 'do',
-                'does', 'did', 'have', 'had', 'has', 'been', 'being'
-            }
-            
             # Clean target by removing stop words but preserve meaningful phrases
             target_words = target.lower().split()
             filtered_words = [word for word in target_words if word not in STOP_WORDS]
             clean_target = ' '.join(filtered_words) if filtered_words else target
             
             action_type = action_plan["action"]
-            page_context = {
-                "url": self.page.url,
-                "title": await self.page.title()
-            }
+            if page_context is None:
+                page_context = {
+                    "url": self.page.url,
+                    "title": await self._page_title()
+                }
             
             # Fast, cheap GPT call for instruction normalization
-            normalization_prompt = f"""
-You are a UI automation expert. Convert this human language instruction into standardized terms that work well with CSS selectors.
-
-INSTRUCTION: "{action_type} on {clean_target}"
-ORIGINAL TARGET: "{target}"
-PAGE CONTEXT: {page_context["title"]} ({page_context["url"]})
-
-Provide 3-5 alternative terms/phrases that could represent the same UI element:
-1. Exact term variations (singular/plural, capitalization)
-2. Common synonyms  
-3. Abbreviated forms
-4. Context-appropriate alternatives
-
-IMPORTANT: Focus on meaningful UI element terms, avoid stop words like 'on', 'the', 'to', 'from', etc.
-
-Return only a JSON list of strings, no explanation:
-["term1", "term2", "term3", ...]
-
-Examples:
-- "workspaces" → ["workspaces", "workspace", "Workspaces", "work space", "projects"]
-- "main menu" → ["menu", "navigation", "nav", "main menu", "header menu"]
-- "create button" → ["create", "Create", "new", "+", "add", "create button"]
-- "sign in" → ["sign in", "login", "log in", "signin", "Log In", "Sign In"]
-"""
+            normalization_prompt = NORMALIZATION_USER_TEMPLATE.format(
+                action=action_type,
+                clean_target=clean_target,
+                target=target,
+                title=page_context["title"],
+                url=page_context["url"]
+            )
 
             # Use existing LLM client for fast normalization
-            if hasattr(self, 'element_detector') and hasattr(self.element_detector, 'vision_client'):
+            vision_client = self.element_detector.vision_client
+            if vision_client is not None:
                 try:
-                    # This is a text-only call, much faster and cheaper than vision
-                    import openai
-                    
-                    # Get API key from vision client's internal openai client
-                    vision_client = self.element_detector.vision_client
-                    api_key = vision_client.client.api_key if hasattr(vision_client.client, 'api_key') else None
-                    
-                    if not api_key:
-                        # Fallback: try to get from credentials again
-                        from ..utils.credentials_loader import get_openai_credentials
-                        creds = get_openai_credentials()
-                        api_key = creds.get('api_key')
-                    
-                    if not api_key:
-                        raise ValueError("No API key available")
-                    
-                    client = openai.AsyncOpenAI(api_key=api_key)
+                    # This is a text-only call, much faster and cheaper than vision.
+                    # Reuse the vision client's AsyncOpenAI instance (and its pooled connections)
+                    client = vision_client.client
                     
                     response = await client.chat.completions.create(
                         model="gpt-4o-mini",  # Fast, cheap model for text processing
-                        messages=[{"role": "user", "content": normalization_prompt}],
-                        max_tokens=100,
-                        temperature=0.1
+                        messages=[
+                            {"role": "system", "content": NORMALIZATION_SYSTEM_PROMPT},
+                            {"role": "user", "content": normalization_prompt}
+                        ],
+                        max_tokens=80,  # Room for ~6 short terms
+                        temperature=0.1,
+                        # JSON mode guarantees parseable output (no markdown fences)
+                        response_format={"type": "json_object"}
                     )
                     
-                    import json
-                    normalized_list = json.loads(response.choices[0].message.content.strip())
+                    normalized_list = json.loads(response.choices[0].message.content)["terms"]
                     
                     # Post-process to filter out any remaining stop words
                     final_terms = []
@@ -1174,7 +1678,10 @@ Examples:
                     if target not in final_terms:
                         final_terms.insert(0, target)
                     
-                    return final_terms[:6]  # Limit to 6 terms max
+                    final_terms = final_terms[:6]  # Limit to 6 terms max
+                    self._normalization_cache[cache_key] = final_terms
+                    self._normalization_cache_dirty = True
+                    return list(final_terms)
                     
                 except Exception as e:
                     print(f"    ⚠️ AI normalization failed: {e}")
@@ -1186,33 +1693,108 @@ Examples:
         except Exception:
             return self._basic_normalization(target)
     
+    def _should_skip_ai(self, target: str) -> bool:
+        """Whether target is a single well-known UI word that basic normalization covers."""
+        words = target.split()
+        return len(words) == 1 and words[0].lower() in KNOWN_SINGLE_WORD_TARGETS
+    
+    def _load_normalization_cache(self) -> None:
+        """Load persisted AI normalization results."""
+        if not self.normalization_cache_file or not self.normalization_cache_file.exists():
+            return
+        
+        try:
+            with open(self.normalization_cache_file, 'r', encoding='utf-8') as f:
+                self._normalization_cache = json.load(f)
+            print(f"💾 Loaded {len(self._normalization_cache)} cached instruction normalizations")
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not load normalization cache: {e}")
+    
+    def _save_normalization_cache(self, max_entries: int = 1024) -> None:
+        """Persist AI normalization results, keeping the most recently used entries."""
+        if not self.normalization_cache_file or not self._normalization_cache_dirty:
+            return
+        
+        entries = list(self._normalization_cache.items())[-max_entries:]
+        try:
+            self._write_json_atomically(self.normalization_cache_file, dict(entries))
+            self._normalization_cache_dirty = False
+        except OSError as e:
+            print(f"⚠️ Could not save normalization cache: {e}")
+    
+    def _load_similar_shot_cache(self) -> None:
+        """Load coordinates remembered for similar screenshots in earlier runs."""
+        if not self.similar_shot_cache_file or not self.similar_shot_cache_file.exists():
+            return
+        
+        try:
+            with open(self.similar_shot_cache_file, 'r', encoding='utf-8') as f:
+                self._similar_shot_cache = json.load(f)
+            print(f"💾 Loaded {len(self._similar_shot_cache)} remembered element locations")
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not load similar-screenshot cache: {e}")
+    
+    def _save_similar_shot_cache(self, max_entries: int = 1024) -> None:
+        """Persist remembered element locations, keeping the most recently updated targets."""
+        if not self.similar_shot_cache_file or not self._similar_shot_cache_dirty:
+            return
+        
+        entries = list(self._similar_shot_cache.items())[-max_entries:]
+        try:
+            self._write_json_atomically(self.similar_shot_cache_file, dict(entries))
+            self._similar_shot_cache_dirty = False
+        except OSError as e:
+            print(f"⚠️ Could not save similar-screenshot cache: {e}")
+    
+    def _load_learned_selectors(self) -> None:
+        """Load selectors learned for targets in earlier runs."""
+        if not self.learned_selectors_file or not self.learned_selectors_file.exists():
+            return
+        
+        try:
+            with open(self.learned_selectors_file, 'r', encoding='utf-8') as f:
+                self._learned_selectors = json.load(f)
+            print(f"💾 Loaded {len(self._learned_selectors)} learned selectors")
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Could not load learned selectors: {e}")
+    
+    def _save_learned_selectors(self, max_entries: int = 1024) -> None:
+        """Persist learned selectors, keeping the most recently learned targets."""
+        if not self.learned_selectors_file or not self._learned_selectors_dirty:
+            return
+        
+        entries = list(self._learned_selectors.items())[-max_entries:]
+        try:
+            self._write_json_atomically(self.learned_selectors_file, dict(entries))
+            self._learned_selectors_dirty = False
+        except OSError as e:
+            print(f"⚠️ Could not save learned selectors: {e}")
+    
+    @staticmethod
+    def _write_json_atomically(path: Path, data: Any) -> None:
+        """Write JSON to a temp file then rename, so concurrent runs never read a half-written file."""
+        tmp_file = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        os.replace(tmp_file, path)
+    
     def _basic_normalization(self, target: str) -> List[str]:
         """Basic normalization fallback when AI is not available."""
-        normalized = [target]
         target_lower = target.lower()
         
-        # Basic variations
-        if target != target.lower():
-            normalized.append(target.lower())
-        if target != target.capitalize():
-            normalized.append(target.capitalize())
-        if target != target.upper():
-            normalized.append(target.upper())
-            
+        # Basic variations (duplicates of the target are dropped below)
+        normalized = [target, target_lower, target.capitalize(), target.upper()]
+        
         # Common synonyms
-        synonyms = {
-            "workspaces": ["workspace", "work space", "projects"],
-            # Ensure 'create dropdown' also searches for 'create'
-            "create dropdown": ["create", "new", "add", "+"],
-            "create": ["new", "add", "+"],
-            "menu": ["navigation", "nav"],
-            "sign in": ["login", "log in", "signin"],
-            "my": ["my", "mine", "personal"],
-            "conversation": ["chat", "conversation", "messaging"]
-        }
+        for phrase, values in BASIC_SYNONYM_PHRASES:
+            if phrase in target_lower:
+                normalized.extend(values)
         
-        for key, values in synonyms.items():
-            if key in target_lower:
+        for word in WORD_PATTERN.findall(target_lower):
+            values = BASIC_SYNONYM_WORDS.get(word)
+            if values is None and word.endswith("s"):
+                values = BASIC_SYNONYM_WORDS.get(word[:-1])  # "conversations" -> "conversation"
+            if values:
                 normalized.extend(values)
         
         return list(dict.fromkeys(normalized))  # Remove duplicates while preserving order
@@ -1223,57 +1805,86 @@ Examples:
             action_type = action_plan["action"]
             
             if action_type == "click":
-                # Try each normalized target
+                # Pool selectors from every normalized target; variants often generate the same
+                # selector, and the first target to produce it is the one reported
+                candidates: Dict[str, tuple] = {}
                 for target in normalized_targets:
-                    print(f"    🔍 Trying selectors for normalized term: '{target}'")
-                    
-                    # Generate smart selectors for this normalized target
-                    selectors = self._generate_smart_selectors(target, action_plan)
-                    
-                    # Sort selectors by priority (lower numbers = higher priority)
-                    selectors.sort(key=lambda x: x.get("priority", 999))
-                    
-                    for selector_info in selectors:
-                        try:
-                            selector = selector_info["selector"]
-                            strategy = selector_info["strategy"]
-                            priority = selector_info["priority"]
-                            print(f"    🔍 SELECTOR DEBUG: Trying {strategy}: {selector}")
-                            
-                            # Try to find the element
-                            element = self.page.locator(selector).first
-                            
-                            # Check if element exists and is visible
-                            if await element.count() > 0:
-                                try:
-                                    if await element.is_visible(timeout=1000):  # Shorter timeout for efficiency
-                                        print(f"    ✅ Found using {strategy} for '{target}': {selector}, priority: {priority}")
-                                        
-                                        # Get element coordinates
-                                        bounding_box = await element.bounding_box()
-                                        if bounding_box:
-                                            center_x = int(bounding_box['x'] + bounding_box['width'] / 2)
-                                            center_y = int(bounding_box['y'] + bounding_box['height'] / 2)
-                                            
-                                            from ..core.models import Coordinates
-                                            return Coordinates(x=center_x, y=center_y)
-                                            
-                                except Exception:
-                                    # Element might not be ready, continue to next selector
-                                    continue
-                                    
-                        except Exception:
-                            # Selector failed, try next one
-                            continue
+                    for selector_info in self._generate_smart_selectors(target, action_plan):
+                        candidates.setdefault(selector_info["selector"], (target, selector_info))
+                
+                print(f"    🔍 Trying {len(candidates)} unique selectors for {len(normalized_targets)} normalized terms")
+                
+                # Stable sort: best priority first, then target order
+                ordered = sorted(candidates.values(), key=lambda item: item[1]["priority"])
+                
+                # Selectors are independent lookups: probe them in concurrent waves so a miss
+                # costs one round-trip per wave rather than one per selector
+                for start in range(0, len(ordered), self._CONCURRENT_SELECTOR_PROBES):
+                    coords = await self._probe_selector_wave(ordered[start:start + self._CONCURRENT_SELECTOR_PROBES])
+                    if coords:
+                        return coords
                         
             return None
             
         except Exception:
             return None
     
+    async def _probe_selector_wave(self, wave: List[tuple]) -> Optional[Coordinates]:
+        """
+        Probe (target, selector_info) pairs concurrently and return the best-ranked hit.
+        
+        Results are consumed in rank order, so a hit returns as soon as every better-ranked
+        probe has missed; the probes still running are cancelled.
+        """
+        probes = [asyncio.ensure_future(self._probe_selector(selector_info)) for _, selector_info in wave]
+        try:
+            for (target, selector_info), probe in zip(wave, probes):
+                bounding_box = await probe
+                if bounding_box:
+                    return self._selector_hit(target, selector_info, bounding_box)
+            return None
+        finally:
+            for probe in probes:
+                probe.cancel()
+    
+    async def _probe_selector(self, selector_info: Dict[str, Any]) -> Optional[Dict[str, float]]:
+        """Bounding box of the first visible match for a generated selector, else None."""
+        selector = selector_info["selector"]
+        if self.debug:
+            print(f"    🔍 SELECTOR DEBUG: Trying {selector_info['strategy']}: {selector}")
+        
+        try:
+            # Skip hidden matches (collapsed nav, closed menus) so .first is the visible one:
+            # visibility:hidden elements still have a box and would be clicked "through"
+            element = self.page.locator(selector).locator("visible=true").first
+            
+            # count() answers immediately for missing elements; bounding_box() would wait for them
+            if await element.count() == 0:
+                return None
+            bounding_box = await element.bounding_box(timeout=1000)
+        except Exception:
+            # Invalid selector or element not ready
+            return None
+        
+        if bounding_box and bounding_box['width'] > 0 and bounding_box['height'] > 0:
+            return bounding_box
+        return None
+    
+    def _selector_hit(self, target: str, selector_info: Dict[str, Any], bounding_box: Dict[str, float]) -> Coordinates:
+        """Report a selector match and return the center of its bounding box."""
+        print(f"    ✅ Found using {selector_info['strategy']} for '{target}': {selector_info['selector']}, priority: {selector_info['priority']}")
+        return self._box_center(bounding_box)
+    
+    @staticmethod
+    def _box_center(bounding_box: Dict[str, float]) -> Coordinates:
+        """Center of a Playwright bounding box, in whole CSS pixels."""
+        return Coordinates(
+            int(bounding_box['x'] + bounding_box['width'] / 2),
+            int(bounding_box['y'] + bounding_box['height'] / 2)
+        )
+    
     def _generate_smart_selectors(self, target: str, action_plan: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Generate intelligent selectors based on target and context."""
-        selectors = []
         target_lower = target.lower()
         
         # 🎯 CHECK FOR UI CONTEXT (dropdown, modal, etc.)
@@ -1282,79 +1893,51 @@ Examples:
         search_scope = action_plan.get("search_scope")
         
         # Strategy 1: Context-aware element matching (HIGHEST priority when context exists)
-        if ui_context_type == "dropdown" and search_scope:
+        if self.debug and ui_context_type == "dropdown" and search_scope:
             print(f"    🎯 Using dropdown-scoped selectors for '{target}' within {ui_context_target} dropdown")
-            # Prioritize elements within dropdown/menu regions
-        selectors.extend([
-                {"selector": f"[role='menu'] [role='menuitem']:has-text('{target}')", "strategy": "dropdown_menuitem", "priority": 0},
-                {"selector": f"[role='menu'] button:has-text('{target}')", "strategy": "dropdown_button", "priority": 0},
-                {"selector": f"[role='menu'] *:has-text('{target}')", "strategy": "dropdown_any", "priority": 0},
-                {"selector": f"[aria-expanded='true'] + * [role='menuitem']:has-text('{target}')", "strategy": "expanded_dropdown_item", "priority": 0},
-                {"selector": f"[aria-expanded='true'] + * button:has-text('{target}')", "strategy": "expanded_dropdown_button", "priority": 0},
-                {"selector": f"[class*='dropdown'][class*='open'] *:has-text('{target}')", "strategy": "open_dropdown_item", "priority": 0},
-                {"selector": f"[class*='menu'][style*='block'] *:has-text('{target}')", "strategy": "visible_menu_item", "priority": 0},
-            ])
+        templates = [self._DROPDOWN_SCOPED_TEMPLATES]
         
         # Strategy 2: Direct text matching (lower priority when context exists, higher when no context)
         text_priority = 3 if ui_context_type else 1
-        print(f"    🔍 UI Context Type: {ui_context_type}, text-priority {text_priority}")
-        selectors.extend([
-            {"selector": f"text='{target}'", "strategy": "exact_text", "priority": text_priority},
-            {"selector": f"text={target}", "strategy": "text_contains", "priority": text_priority + 1},
-        ])
+        if self.debug:
+            print(f"    🔍 UI Context Type: {ui_context_type}, text-priority {text_priority}")
+        templates.append((
+            ("text='{t}'", "exact_text", text_priority),
+            ("text={t}", "text_contains", text_priority + 1),
+        ))
         
         # Strategy 2: Enhanced semantic element matching
-        if "dropdown" in target_lower or "create" in target_lower:
-            # Prioritize dropdown buttons with visual indicators
-            selectors.extend([
-                {"selector": f"button:has-text('{target}')[aria-haspopup='true']:not([role='tab'])", "strategy": "dropdown_button_aria", "priority": 1},
-                {"selector": f"button:has-text('{target}')[aria-expanded]:not([role='tab'])", "strategy": "dropdown_button_expanded", "priority": 1},
-                {"selector": f"button:has-text('{target}'):has(svg, [class*='arrow'], [class*='chevron'])", "strategy": "button_with_arrow", "priority": 2},
-                {"selector": f"button:has-text('{target}')[class*='dropdown']:not([role='tab'])", "strategy": "dropdown_button_class", "priority": 3},
-            ])
+        if DROPDOWN_SELECTOR_PATTERN.search(target_lower):
+            templates.append(self._DROPDOWN_BUTTON_TEMPLATES)
         
         # Strategy 3: Button matching with tab exclusion
-        selectors.extend([
-            {"selector": f"button:has-text('{target}'):not([role='tab'])", "strategy": "button_not_tab", "priority": 3},
-            {"selector": f"[role='button']:has-text('{target}'):not([role='tab'])", "strategy": "role_button_not_tab", "priority": 4},
-            {"selector": f"button:has-text('{target}')", "strategy": "button_text", "priority": 5},
-        ])
+        templates.append(self._BUTTON_TEMPLATES)
         
         # Strategy 4: Link matching
-        if any(word in target_lower for word in ["workspace", "sign in", "login"]):
-            selectors.extend([
-                {"selector": f"a:has-text('{target}')", "strategy": "link_text", "priority": 5},
-                {"selector": f"[href*='{target.lower()}']", "strategy": "link_href", "priority": 6},
-            ])
+        if LINK_SELECTOR_PATTERN.search(target_lower):
+            templates.append(self._LINK_TEMPLATES)
         
         # Strategy 5: Menu item matching
-        selectors.extend([
-            {"selector": f"[role='menuitem']:has-text('{target}')", "strategy": "menu_item", "priority": 6},
-            {"selector": f"li:has-text('{target}')", "strategy": "list_item", "priority": 7},
-        ])
+        templates.append(self._MENU_ITEM_TEMPLATES)
         
         # Strategy 6: Input field and text area matching (for input-related targets)
-        if any(word in target_lower for word in ["query", "search", "input", "text", "message", "files"]):
-            selectors.extend([
-                {"selector": f"input[placeholder*='{target}' i]", "strategy": "input_placeholder", "priority": 2},
-                {"selector": f"textarea[placeholder*='{target}' i]", "strategy": "textarea_placeholder", "priority": 2},
-                {"selector": f"[contenteditable][placeholder*='{target}' i]", "strategy": "contenteditable_placeholder", "priority": 2},
-                {"selector": f"input[aria-label*='{target}' i]", "strategy": "input_aria_label", "priority": 3},
-                {"selector": f"textarea[aria-label*='{target}' i]", "strategy": "textarea_aria_label", "priority": 3},
-                {"selector": f"div:has-text('{target}') input", "strategy": "labeled_input", "priority": 4},
-                {"selector": f"div:has-text('{target}') textarea", "strategy": "labeled_textarea", "priority": 4},
-            ])
+        if INPUT_SELECTOR_PATTERN.search(target_lower):
+            templates.append(self._INPUT_TEMPLATES)
         
         # Strategy 7: Generic interactive elements
-        selectors.extend([
-            {"selector": f"*:has-text('{target}')[onclick]", "strategy": "clickable_element", "priority": 8},
-            {"selector": f"div:has-text('{target}')[role='button']", "strategy": "div_button", "priority": 9},
-        ])
-        
-        # Sort by priority (lower number = higher priority)
-        selectors.sort(key=lambda x: x["priority"])
+        templates.append(self._GENERIC_TEMPLATES)
+        
+        # Emit in priority order (lower number = higher priority) by bucketing, no sort needed
+        buckets = [[] for _ in range(self._MAX_SELECTOR_PRIORITY + 1)]
+        for group in templates:
+            for template, strategy, priority in group:
+                buckets[priority].append({
+                    "selector": template.format(t=target, tl=target_lower),
+                    "strategy": strategy,
+                    "priority": priority
+                })
         
-        return selectors
+        return list(chain.from_iterable(buckets))
     
     async def _analyze_natural_viewport(self) -> None:
         """Analyze the natural browser viewport without forcing any changes."""
@@ -1412,7 +1995,7 @@ Examples:
     def _validate_coordinates_in_viewport(self, coordinates: Coordinates) -> bool:
         """Validate that coordinates are within the natural viewport bounds."""
         try:
-            if not hasattr(self, '_current_viewport'):
+            if not self._current_viewport:
                 return True  # Skip validation if viewport info not available
             
             viewport = self._current_viewport
@@ -1434,11 +2017,18 @@ Examples:
             return True  # Default to valid if validation fails
     
     async def _get_viewport_info(self) -> dict:
-        """Get detailed viewport and browser window information with retries."""
-        for attempt in range(3):
+        """Get detailed viewport and browser window information (retried only on errors)."""
+        cached_info = self._page_meta.get("viewport")
+        if cached_info:
+            return cached_info
+        
+        for attempt in range(2):
             try:
-                # Ensure page is ready
-                await asyncio.sleep(0.2)
+                # window.* dimensions are available as soon as the document exists
+                try:
+                    await self.page.wait_for_load_state('domcontentloaded', timeout=2000)
+                except Exception:
+                    pass  # A slow DOMContentLoaded does not stop us reading dimensions
                 
                 viewport_info = await self.page.evaluate("""
                     () => {
@@ -1487,16 +2077,14 @@ Examples:
                     }
                 """)
                 
-                # Validate we got reasonable data
+                # The script already substitutes defaults for anything it cannot read
                 if viewport_info.get('screenWidth', 0) > 0:
+                    self._page_meta["viewport"] = viewport_info
                     return viewport_info
-                else:
-                    print(f"    ⚠️ Attempt {attempt + 1}: Got invalid viewport data, retrying...")
-                    await asyncio.sleep(0.5)
+                break
                     
             except Exception as e:
                 print(f"    ⚠️ Attempt {attempt + 1}: Viewport info failed: {e}")
-                await asyncio.sleep(0.5)
         
         # Final fallback with reasonable defaults
         return {
@@ -1513,40 +2101,77 @@ Examples:
     async def _take_analysis_screenshot(self, step_number: int) -> Optional[str]:
         """Take screenshot for AI vision analysis with viewport logging."""
         
-        Path("test_results").mkdir(exist_ok=True)
-        screenshot_path = f"test_results/vision_analysis_step_{step_number}_{int(time.time())}.png"
+        screenshot_path = f"{self.results_dir}/vision_analysis_step_{step_number}_{int(time.time())}.jpg"
         
+        # ♻️ Nothing on the page changed since the last analysis capture: analyze the same image.
+        # The version is read before capturing, so a change during the capture forces a new one
         try:
+            visual_state = (self.page.url, await self.page.evaluate("() => window.__qq_visualVersion"))
+        except Exception:
+            visual_state = None
+        captured_at = time.monotonic()
+        if (
+            visual_state is not None and self._last_analysis_shot and self._last_analysis_shot[0] == visual_state
+            and time.monotonic() - self._last_analysis_shot[2] < ANALYSIS_SHOT_REUSE_SECONDS
+        ):
+            print(f"    ♻️ Page unchanged since last analysis screenshot - reusing {self._last_analysis_shot[1]}")
+            return self._last_analysis_shot[1]
+        
+        try:
+            # Viewport info and the capture are independent CDP round-trips, so overlap them.
+            # JPEG keeps the upload to the vision model several times smaller than PNG
+            viewport_info, image = await asyncio.gather(
+                self._get_viewport_info(),
+                self.page.screenshot(path=screenshot_path, type="jpeg", quality=60, full_page=False)
+            )
+            self._last_analysis_image = (screenshot_path, image)
+            print(f"    📸 Screenshot for vision analysis: {screenshot_path}")
+            
             # 🔍 LOG VIEWPORT INFORMATION
-            viewport_info = await self._get_viewport_info()
-            print(f"    📏 Viewport Analysis:")
-            print(f"       Viewport: {viewport_info.get('viewportWidth', 'unknown')}x{viewport_info.get('viewportHeight', 'unknown')}")
-            print(f"       Window: {viewport_info.get('windowWidth', 'unknown')}x{viewport_info.get('windowHeight', 'unknown')}")
-            print(f"       Screen: {viewport_info.get('screenWidth', 'unknown')}x{viewport_info.get('screenHeight', 'unknown')}")
-            print(f"       Device Pixel Ratio: {viewport_info.get('devicePixelRatio', 'unknown')}")
-            print(f"       Document: {viewport_info.get('documentWidth', 'unknown')}x{viewport_info.get('documentHeight', 'unknown')}")
-            print(f"       Scroll: ({viewport_info.get('scrollX', 'unknown')}, {viewport_info.get('scrollY', 'unknown')})")
+            if self.debug:
+                print(
+                    f"    📏 Viewport Analysis:\n"
+                    f"       Viewport: {viewport_info.get('viewportWidth', 'unknown')}x{viewport_info.get('viewportHeight', 'unknown')}\n"
+                    f"       Window: {viewport_info.get('windowWidth', 'unknown')}x{viewport_info.get('windowHeight', 'unknown')}\n"
+                    f"       Screen: {viewport_info.get('screenWidth', 'unknown')}x{viewport_info.get('screenHeight', 'unknown')}\n"
+                    f"       Device Pixel Ratio: {viewport_info.get('devicePixelRatio', 'unknown')}\n"
+                    f"       Document: {viewport_info.get('documentWidth', 'unknown')}x{viewport_info.get('documentHeight', 'unknown')}\n"
+                    f"       Scroll: ({viewport_info.get('scrollX', 'unknown')}, {viewport_info.get('scrollY', 'unknown')})"
+                )
             
-            await self.page.screenshot(path=screenshot_path, full_page=False)
-            print(f"    📸 Screenshot for vision analysis: {screenshot_path}")
+            # Keep coordinate validation in step with the viewport the screenshot shows
+            if viewport_info.get('viewportWidth', 0) > 0 and viewport_info.get('viewportHeight', 0) > 0 and not viewport_info.get('fallback'):
+                self._current_viewport = {
+                    'width': viewport_info['viewportWidth'],
+                    'height': viewport_info['viewportHeight'],
+                    'dpr': viewport_info.get('devicePixelRatio', 1)
+                }
             
             # 🎬 Skip adding analysis screenshots to GIF to avoid overcrowding
             # Only add if no step screenshot exists yet
             if step_number not in self.gif_creator._step_screenshots:
                 self.gif_creator.add_step_screenshot(screenshot_path, step_number, "analysis")
             
+            if visual_state is not None and visual_state[1] is not None:
+                self._last_analysis_shot = (visual_state, screenshot_path, captured_at)
             return screenshot_path
         except Exception as e:
             print(f"    ⚠️ Could not take analysis screenshot: {e}")
             return None
     
+    def _analysis_image(self, screenshot_path: str) -> Optional[bytes]:
+        """Encoded bytes of an analysis screenshot if it is the one still held in memory."""
+        if self._last_analysis_image and self._last_analysis_image[0] == screenshot_path:
+            return self._last_analysis_image[1]
+        return None
+    
     async def _take_step_screenshot(self, step_number: int) -> str:
         """Take screenshot at the beginning of each step for GIF creation."""
-        Path("test_results/steps").mkdir(parents=True, exist_ok=True)
-        screenshot_path = f"test_results/steps/vision_step_{step_number}_start.png"
+        screenshot_path = f"{self.steps_dir}/vision_step_{step_number}_start.jpg"
         
         try:
-            await self.page.screenshot(path=screenshot_path)
+            # GIF frames are downscaled and palettized anyway, so a JPEG loses nothing visible
+            await self.page.screenshot(path=screenshot_path, type="jpeg", quality=70)
             print(f"    📸 Vision Step {step_number} screenshot: {screenshot_path}")
             
             # 🎬 Add to GIF queue (step screenshot - lowest priority)
@@ -1562,69 +2187,30 @@ Examples:
         
         try:
             # 🎯 VISUAL FEEDBACK: Highlight target area before clicking
-            print(f"    🎯 Preparing to click at coordinates ({coordinates.x}, {coordinates.y})")
+            print(f"    🖱️ Clicking at vision coordinates ({coordinates.x}, {coordinates.y})")
             await self._highlight_click_target(coordinates)
             
             # Store current URL to detect navigation
             initial_url = self.page.url
-            initial_title = await self.page.title()
-            
-            # 🖱️ ENHANCED CLICK EXECUTION with debugging
-            print(f"    🖱️ Clicking at vision coordinates ({coordinates.x}, {coordinates.y})")
+            # Live read: scripts may retitle the page without navigating, and a stale
+            # baseline would be reported as a title change caused by the click
+            initial_title = await self._page_title(refresh=True)
             
-            # 🔍 PRE-CLICK DEBUGGING
-            print(f"    🔍 Pre-click page state:")
-            print(f"       URL: {initial_url}")
-            print(f"       Title: {initial_title}")
-            print(f"       Ready state: {await self.page.evaluate('document.readyState')}")
-            
-            # 🎯 INSPECT ELEMENT AT COORDINATES
-            try:
-                element_info = await self.page.evaluate(f"""
-                    (() => {{
-                        const element = document.elementFromPoint({coordinates.x}, {coordinates.y});
-                        if (element) {{
-                            return {{
-                                tagName: element.tagName,
-                                id: element.id || '',
-                                className: element.className || '',
-                                textContent: element.textContent ? element.textContent.substring(0, 50) : '',
-                                type: element.type || '',
-                                placeholder: element.placeholder || '',
-                                name: element.name || '',
-                                role: element.getAttribute('role') || '',
-                                ariaLabel: element.getAttribute('aria-label') || ''
-                            }};
-                        }} else {{
-                            return null;
-                        }}
-                    }})()
-                """)
-                
-                if element_info:
-                    print(f"    🎯 Element at ({coordinates.x}, {coordinates.y}):")
-                    print(f"       Tag: {element_info.get('tagName', 'N/A')}")
-                    print(f"       ID: {element_info.get('id', 'N/A') or 'None'}")
-                    print(f"       Class: {element_info.get('className', 'N/A') or 'None'}")
-                    print(f"       Type: {element_info.get('type', 'N/A') or 'None'}")
-                    print(f"       Name: {element_info.get('name', 'N/A') or 'None'}")
-                    print(f"       Placeholder: {element_info.get('placeholder', 'N/A') or 'None'}")
-                    print(f"       Role: {element_info.get('role', 'N/A') or 'None'}")
-                    print(f"       Aria-label: {element_info.get('ariaLabel', 'N/A') or 'None'}")
-                    print(f"       Text: {element_info.get('textContent', 'N/A')[:50] or 'None'}")
-                else:
-                    print(f"    ⚠️ No element found at coordinates ({coordinates.x}, {coordinates.y})")
-            except Exception as e:
-                print(f"    ⚠️ Could not inspect element: {e}")
+            # 🔍 PRE-CLICK DEBUGGING: page state and element at coordinates in one round-trip
+            if self.debug:
+                await self._log_click_target(coordinates, initial_url, initial_title)
             
             # 🎯 ENSURE PAGE IS INTERACTIVE
             try:
                 await self.page.wait_for_load_state('domcontentloaded', timeout=5000)
                 await asyncio.sleep(0.5)  # Extra stability wait
                 print(f"    ✅ Page confirmed ready for interaction")
-            except:
+            except PlaywrightTimeoutError:
                 print(f"    ⚠️ Page might not be fully ready, proceeding anyway")
             
+            # 👀 Start watching for the page's reaction before it can happen
+            reaction_watch = await self._watch_for_page_reaction(1.2)
+            
             # 🖱️ PERFORM ACTUAL CLICK with error handling and fallback
             click_success = False
             try:
@@ -1638,16 +2224,11 @@ Examples:
                 # Method 2: Alternative click using JavaScript
                 try:
                     print(f"    🔄 Trying alternative JavaScript click...")
-                    await self.page.evaluate(f"""
-                        const element = document.elementFromPoint({coordinates.x}, {coordinates.y});
-                        if (element) {{
-                            console.log('Found element at coordinates:', element);
-                            element.click();
-                            console.log('JavaScript click executed');
-                        }} else {{
-                            console.log('No element found at coordinates');
-                        }}
-                    """)
+                    clicked = await self.page.evaluate(
+                        "([x, y]) => window.__qq_clickAt(x, y)", [coordinates.x, coordinates.y]
+                    )
+                    if not clicked:
+                        print(f"    ⚠️ No element found at coordinates for JavaScript click")
                     print(f"    ✅ JavaScript click executed")
                     click_success = True
                 except Exception as js_error:
@@ -1658,21 +2239,22 @@ Examples:
                 return False
             
             # 📸 IMMEDIATE POST-CLICK SCREENSHOT
-            await self._capture_action_screenshot("click", coordinates)
+            self._schedule_action_screenshot("click", coordinates)
             
             # 🔄 ENHANCED CHANGE DETECTION
             print(f"    ⏳ Monitoring for page changes...")
             
-            # Wait for immediate DOM reactions
-            await asyncio.sleep(1.2)  # Longer wait to catch slower responses
+            # Wait for the first DOM mutation or navigation rather than a fixed delay
+            reaction = await self._wait_for_page_reaction(reaction_watch, 1.2)
+            if self.debug:
+                print(f"    🔍 Page reaction: {reaction}")
             
             # Check for any page changes
             current_url = self.page.url
-            current_title = await self.page.title()
+            current_title = await self._page_title(refresh=True)
             
-            print(f"    🔍 Post-click page state:")
-            print(f"       URL: {current_url}")
-            print(f"       Title: {current_title}")
+            if self.debug:
+                print(f"    🔍 Post-click page state:\n       URL: {current_url}\n       Title: {current_title}")
             
             if current_url != initial_url:
                 print(f"    🔄 Navigation detected: {initial_url} → {current_url}")
@@ -1688,7 +2270,7 @@ Examples:
             else:
                 print(f"    ⚠️ No page changes detected - click might not have worked")
                 # Take another screenshot to compare
-                await self._capture_action_screenshot("post_click_check", coordinates)
+                self._schedule_action_screenshot("post_click_check", coordinates)
                 await asyncio.sleep(0.5)
                 
             return True
@@ -1710,74 +2292,120 @@ Examples:
                 print(f"    ❌ Click at coordinates failed: {e}")
                 return False
     
+    async def _watch_for_page_reaction(self, timeout: float) -> bool:
+        """Arm a page-side MutationObserver for the next action; False if it could not be armed."""
+        try:
+            return bool(await self.page.evaluate(
+                "(ms) => window.__qq_watchMutations(ms)", int(timeout * 1000)
+            ))
+        except Exception:
+            return False
+    
+    async def _wait_for_page_reaction(self, armed: bool, timeout: float) -> str:
+        """
+        Wait until the page mutates or navigates after an action, at most timeout seconds.
+        
+        Returns "mutation", "navigation", "timeout", or "unknown" when the context went away.
+        """
+        if not armed:
+            await asyncio.sleep(timeout)
+            return "timeout"
+        
+        mutation = asyncio.ensure_future(self.page.evaluate("() => window.__qq_mutationPromise"))
+        navigation = asyncio.ensure_future(
+            self.page.wait_for_event("framenavigated", timeout=timeout * 1000)
+        )
+        done, pending = await asyncio.wait(
+            {mutation, navigation}, timeout=timeout + 0.5, return_when=asyncio.FIRST_COMPLETED
+        )
+        for task in pending:
+            task.cancel()
+        errors = {task: task.exception() for task in done}
+        
+        if navigation in done and errors[navigation] is None:
+            return "navigation"
+        if mutation in done and errors[mutation] is None:
+            # A document loaded since arming has no promise, which means we navigated
+            return mutation.result() or "navigation"
+        if mutation in done:
+            # The evaluate fails when a navigation destroys the execution context
+            return "unknown"
+        return "timeout"
+    
+    async def _log_click_target(self, coordinates: Coordinates, url: str, title: str) -> None:
+        """Print page state and the element under the coordinates before a click (debug only)."""
+        try:
+            state = await self.page.evaluate(
+                "([x, y]) => window.__qq_describeAt(x, y)", [coordinates.x, coordinates.y]
+            )
+        except Exception as e:
+            print(f"    ⚠️ Could not inspect element: {e}")
+            return
+        
+        lines = [
+            f"    🔍 Pre-click page state:",
+            f"       URL: {url}",
+            f"       Title: {title}",
+            f"       Ready state: {state.get('ready')}",
+        ]
+        
+        element_info = state.get('element')
+        if element_info:
+            lines += [
+                f"    🎯 Element at ({coordinates.x}, {coordinates.y}):",
+                f"       Tag: {element_info.get('tagName', 'N/A')}",
+                f"       ID: {element_info.get('id', 'N/A') or 'None'}",
+                f"       Class: {element_info.get('className', 'N/A') or 'None'}",
+                f"       Type: {element_info.get('type', 'N/A') or 'None'}",
+                f"       Name: {element_info.get('name', 'N/A') or 'None'}",
+                f"       Placeholder: {element_info.get('placeholder', 'N/A') or 'None'}",
+                f"       Role: {element_info.get('role', 'N/A') or 'None'}",
+                f"       Aria-label: {element_info.get('ariaLabel', 'N/A') or 'None'}",
+                f"       Text: {element_info.get('textContent', 'N/A')[:50] or 'None'}",
+            ]
+        else:
+            lines.append(f"    ⚠️ No element found at coordinates ({coordinates.x}, {coordinates.y})")
+        print("\n".join(lines))
+    
     async def _highlight_click_target(self, coordinates: Coordinates) -> None:
         """Add visual highlight to show where we're about to click."""
         try:
-            # Inject CSS and JavaScript to create a visual highlight
-            highlight_script = f"""
-            (function() {{
-                // Remove any existing highlights
-                const existing = document.getElementById('quantum-click-target');
-                if (existing) existing.remove();
-                
-                // Create highlight element
-                const highlight = document.createElement('div');
-                highlight.id = 'quantum-click-target';
-                highlight.style.cssText = `
-                    position: fixed;
-                    left: {coordinates.x - 15}px;
-                    top: {coordinates.y - 15}px;
-                    width: 30px;
-                    height: 30px;
-                    border: 3px solid #ff0000;
-                    border-radius: 50%;
-                    background: rgba(255, 0, 0, 0.2);
-                    z-index: 999999;
-                    pointer-events: none;
-                    animation: quantum-pulse 0.8s ease-in-out;
-                `;
-                
-                // Add pulse animation
-                const style = document.createElement('style');
-                style.textContent = `
-                    @keyframes quantum-pulse {{
-                        0% {{ transform: scale(0.5); opacity: 1; }}
-                        50% {{ transform: scale(1.2); opacity: 0.8; }}
-                        100% {{ transform: scale(1); opacity: 0.6; }}
-                    }}
-                `;
-                document.head.appendChild(style);
-                document.body.appendChild(highlight);
-                
-                // Auto-remove after 1 second
-                setTimeout(() => {{
-                    if (document.getElementById('quantum-click-target')) {{
-                        document.getElementById('quantum-click-target').remove();
-                    }}
-                }}, 1000);
-            }})();
-            """
-            
-            await self.page.evaluate(highlight_script)
-            await asyncio.sleep(0.6)  # Give time for visual feedback
+            await self.page.evaluate(
+                "([x, y]) => window.__qq_highlightAt(x, y)", [coordinates.x, coordinates.y]
+            )
+            # Only hold the click back for the pulse when someone is watching
+            if self.visual_pause_seconds:
+                await asyncio.sleep(0.6)
             
         except Exception as e:
             print(f"    ⚠️ Could not add visual highlight: {e}")
     
+    def _schedule_action_screenshot(self, action_type: str, coordinates: Coordinates = None) -> None:
+        """Capture an action screenshot in the background so the action itself is not held up."""
+        self._screenshot_tasks = [task for task in self._screenshot_tasks if not task.done()]
+        if len(self._screenshot_tasks) >= self._MAX_PENDING_SCREENSHOTS:
+            print(f"    ⚠️ Screenshot backlog full - skipping {action_type} screenshot")
+            return
+        self._screenshot_tasks.append(
+            asyncio.ensure_future(self._capture_action_screenshot(action_type, coordinates))
+        )
+    
+    async def _flush_action_screenshots(self) -> None:
+        """Wait for background action screenshots to finish."""
+        if self._screenshot_tasks:
+            await asyncio.gather(*self._screenshot_tasks, return_exceptions=True)
+            self._screenshot_tasks.clear()
+    
     async def _capture_action_screenshot(self, action_type: str, coordinates: Coordinates = None) -> None:
         """Capture screenshot of the action for visual feedback."""
         try:
-            timestamp = int(time.time())
-            step_num = getattr(self, '_current_step', 0)
-            
-            Path("test_results/actions").mkdir(parents=True, exist_ok=True)
-            
-            if coordinates:
-                screenshot_path = f"test_results/actions/step_{step_num}_{action_type}_at_{coordinates.x}_{coordinates.y}_{timestamp}.png"
-            else:
-                screenshot_path = f"test_results/actions/step_{step_num}_{action_type}_{timestamp}.png"
+            step_num = self._current_step
+            location = f"_at_{coordinates.x}_{coordinates.y}" if coordinates else ""
+            screenshot_path = f"{self.actions_dir}/step_{step_num}_{action_type}{location}_{self._step_timestamp}.jpg"
             
-            await self.page.screenshot(path=screenshot_path)
+            # One capture at a time keeps GIF frames in action order
+            async with self._screenshot_lock:
+                await self._write_trace_screenshot(screenshot_path)
             print(f"    📸 Action screenshot: {screenshot_path}")
             
             # 🎬 Add to GIF queue (action screenshot - high priority, replaces step screenshot)
@@ -1786,6 +2414,40 @@ Examples:
         except Exception as e:
             print(f"    ⚠️ Could not capture action screenshot: {e}")
     
+    async def _write_trace_screenshot(self, screenshot_path: str) -> None:
+        """
+        Save a viewport JPEG of the page for the action trace.
+        
+        Uses CDP Page.captureScreenshot directly, skipping page.screenshot()'s waits for
+        fonts and stable animations; falls back to page.screenshot() if CDP is unavailable.
+        """
+        if self._cdp_session is None:
+            try:
+                self._cdp_session = await self.context.new_cdp_session(self.page)
+            except Exception:
+                self._cdp_session = False  # Not Chromium, or session refused
+        
+        if self._cdp_session:
+            try:
+                capture = await self._cdp_session.send("Page.captureScreenshot", {
+                    "format": "jpeg",
+                    "quality": 60,
+                    "captureBeyondViewport": False
+                })
+                image = base64.b64decode(capture["data"])
+                await asyncio.to_thread(Path(screenshot_path).write_bytes, image)
+                return
+            except Exception:
+                # Stale session (e.g. target swapped): drop it and open a fresh one next time
+                stale_session, self._cdp_session = self._cdp_session, None
+                try:
+                    await stale_session.detach()
+                except Exception:
+                    pass
+        
+        # Viewport JPEGs encode several times faster than PNG; these are only trace frames
+        await self.page.screenshot(path=screenshot_path, type="jpeg", quality=60, full_page=False)
+    
     async def _wait_for_page_stability(self, navigation: bool = True, target_hint: str = None) -> None:
         """Intelligent page stability waiting with early element-ready detection."""
         try:
@@ -1796,7 +2458,6 @@ Examples:
                 
                 # Step 2: 🚀 SMART EARLY DETECTION - Check if target element is already ready
                 if target_hint:
-                    early_check_start = time.time()
                     element_ready = await self._check_target_element_ready(target_hint)
                     if element_ready:
                         time_saved = 2.0 if self.enable_caching else 5.0  # Estimate time saved
@@ -1812,13 +2473,21 @@ Examples:
                     await self._smart_wait_with_target_checks(0.3, 2.0, target_hint)
                     print(f"    🚀 Smart load completed (cached + target-aware)")
                 else:
-                    # For non-cached, still try to detect target early
-                    try:
-                        # Quick network check, but don't wait too long
-                        await self.page.wait_for_load_state('networkidle', timeout=3000)
-                        print(f"    🌐 Network activity settled")
-                    except:
-                        print(f"    ⚡ Network still active - checking target anyway")
+                    # For non-cached, proceed as soon as the target shows up, even before network idle
+                    if not target_hint:
+                        try:
+                            # Quick network check, but don't wait too long
+                            await self.page.wait_for_load_state('networkidle', timeout=3000)
+                            print(f"    🌐 Network activity settled")
+                        except PlaywrightTimeoutError:
+                            print(f"    ⚡ Network still active - continuing anyway")
+                    elif await self._wait_for_network_idle_or_target(target_hint, 3.0):
+                        time_saved = 1.0  # Estimate time saved
+                        self.smart_loading_saves += 1
+                        self.total_wait_time_saved += time_saved
+                        self.early_element_detections += 1
+                        print(f"    🎯 Target element ready before network settled! (saved ~{time_saved:.1f}s)")
+                        return
                     
                     # Final check for target availability
                     if target_hint:
@@ -1831,12 +2500,13 @@ Examples:
                             print(f"    🎯 Target element ready - proceeding early! (saved ~{time_saved:.1f}s)")
                             return
                     
-                    # Minimal fallback wait
-                    await asyncio.sleep(0.5)
+                    # Minimal fallback wait, cut short once the DOM settles
+                    await self._wait_for_dom_quiet(0.5)
                     print(f"    ⏱️ Load completed with target awareness")
             else:
-                # For non-navigation updates, much faster
-                await asyncio.sleep(0.2)
+                # For non-navigation updates, much faster: wait for the DOM to settle, within the
+                # old fixed 0.2s + 0.1s budget (tickers and carousels never go quiet)
+                await self._wait_for_dom_quiet(0.3)
                 
                 # Quick target check for non-navigation actions
                 if target_hint:
@@ -1845,15 +2515,15 @@ Examples:
                         print(f"    🎯 Target element ready immediately")
                         return
                 
-                # Quick loading indicator check
+                # Quick loading indicator check. 'hidden' also resolves for indicators that stay in
+                # the DOM but are hidden when idle, which 'detached' waited out to the timeout
                 try:
                     await self.page.wait_for_selector('.loading, .spinner, [data-loading="true"]', 
-                                                   state='detached', timeout=1000)
+                                                   state='hidden', timeout=1000)
                     print(f"    ✅ Loading indicators cleared")
-                except:
+                except PlaywrightTimeoutError:
                     pass
                 
-                await asyncio.sleep(0.1)
                 print(f"    ✅ Page updates ready")
                 
         except Exception as e:
@@ -1864,23 +2534,87 @@ Examples:
         await asyncio.sleep(initial_wait)
         
         if not target_hint:
-            await asyncio.sleep(max_wait - initial_wait)
+            await self._wait_for_dom_quiet(max_wait - initial_wait)
             return
         
-        # Check target availability every 200ms for up to max_wait
+        # The page itself watches for the target for up to max_wait, instead of us polling it
         start_time = time.time()
-        check_interval = 0.2
-        
-        while (time.time() - start_time) < max_wait:
-            if await self._check_target_element_ready(target_hint):
-                elapsed = time.time() - start_time
-                time_saved = max_wait - elapsed
-                self.smart_loading_saves += 1
-                self.total_wait_time_saved += time_saved
-                self.early_element_detections += 1
-                print(f"    🚀 Target element ready after {elapsed:.1f}s - proceeding! (saved {time_saved:.1f}s)")
-                return
-            await asyncio.sleep(check_interval)
+        if await self._wait_for_target_element(target_hint, max_wait):
+            elapsed = time.time() - start_time
+            time_saved = max_wait - elapsed
+            self.smart_loading_saves += 1
+            self.total_wait_time_saved += time_saved
+            self.early_element_detections += 1
+            print(f"    🚀 Target element ready after {elapsed:.1f}s - proceeding! (saved {time_saved:.1f}s)")
+    
+    async def _wait_for_target_element(self, target_hint: str, timeout: float) -> bool:
+        """
+        Wait until any quick selector for the target is visible, then check it is enabled.
+        
+        One wait_for_selector() on the union of selectors lets Playwright watch the page
+        itself. A target the union cannot express (e.g. quotes breaking the selector)
+        falls back to waiting for the DOM to settle.
+        """
+        quick_selectors = self._generate_quick_selectors(target_hint) if len(target_hint.strip()) >= 2 else []
+        if not quick_selectors:
+            await self._wait_for_dom_quiet(timeout)
+            return False
+        
+        deadline = time.monotonic() + timeout
+        try:
+            element = await self.page.wait_for_selector(
+                ", ".join(quick_selectors), state="visible", timeout=timeout * 1000
+            )
+            if element and await element.is_enabled():
+                print(f"    🎯 Found ready element for '{target_hint}'")
+                return True
+            return False
+        except PlaywrightTimeoutError:
+            return False
+        except Exception:
+            await self._wait_for_dom_quiet(max(deadline - time.monotonic(), 0))
+            return False
+    
+    async def _wait_for_network_idle_or_target(self, target_hint: str, timeout: float) -> bool:
+        """Wait for network idle or the target, whichever comes first. True if the target won."""
+        network_idle = asyncio.ensure_future(self.page.wait_for_load_state('networkidle', timeout=timeout * 1000))
+        target_ready = asyncio.ensure_future(self._wait_for_target_element(target_hint, timeout))
+        
+        done, _ = await asyncio.wait({network_idle, target_ready}, return_when=asyncio.FIRST_COMPLETED)
+        if target_ready in done and target_ready.result():
+            network_idle.cancel()
+            return True
+        
+        # Network settled first (or the target wait gave up): finish the network wait as before
+        target_ready.cancel()
+        try:
+            await network_idle
+            print(f"    🌐 Network activity settled")
+        except PlaywrightTimeoutError:
+            print(f"    ⚡ Network still active - checking target anyway")
+        return False
+    
+    async def _wait_for_dom_quiet(self, max_wait: float, quiet_ms: int = 100) -> bool:
+        """
+        Poll until the page has not mutated the DOM for quiet_ms, at most max_wait seconds.
+        
+        The poll interval doubles from 50ms up to 800ms. Returns False on timeout.
+        """
+        deadline = time.monotonic() + max_wait
+        delay = 0.05
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(delay, remaining))
+            
+            try:
+                idle_ms = await self.page.evaluate("() => window.__qq_domIdleMs()")
+            except Exception:
+                idle_ms = None  # Context replaced mid-navigation; keep waiting
+            if idle_ms is not None and idle_ms >= quiet_ms:
+                return True
+            delay = min(delay * 2, 0.8)
     
     async def _check_target_element_ready(self, target_hint: str) -> bool:
         """Check if target element is available and interactive."""
@@ -1903,12 +2637,12 @@ Examples:
                         if is_visible and is_enabled:
                             print(f"    🎯 Found ready element: {selector}")
                             return True
-                except:
+                except Exception:
                     continue  # Try next selector
             
             return False
             
-        except Exception as e:
+        except Exception:
             return False
     
     def _generate_quick_selectors(self, target: str) -> List[str]:
@@ -1955,33 +2689,52 @@ Examples:
     
     async def _setup_resource_filtering(self) -> None:
         """Set up resource filtering for faster page loads when visual elements aren't needed."""
-        try:
-            # Block unnecessary resources for faster loading (can be disabled for visual testing)
-            # NOTE: Only block analytics and social media trackers - keep images for vision testing
-            await self.page.route("**/analytics*", lambda route: route.abort())
-            await self.page.route("**/google-analytics*", lambda route: route.abort())
-            await self.page.route("**/gtag*", lambda route: route.abort())
-            await self.page.route("**/facebook*", lambda route: route.abort())
-            await self.page.route("**/twitter*", lambda route: route.abort())
-            await self.page.route("**/doubleclick*", lambda route: route.abort())
-            await self.page.route("**/googlesyndication*", lambda route: route.abort())
+        # Popups and tabs opened by the test load trackers too; filter each as it appears
+        if self._filtered_context is not self.context:
+            self.context.on("page", self._on_context_page)
+            self._filtered_context = self.context
+        
+        if await self._block_trackers(self.page):
             print(f"    🚫 Resource filtering enabled (analytics and trackers blocked)")
+    
+    def _on_context_page(self, page) -> None:
+        """Block trackers in a page opened after setup (its first requests may precede the filter)."""
+        asyncio.ensure_future(self._block_trackers(page))
+    
+    async def _block_trackers(self, page) -> bool:
+        """Have Chrome block tracker URLs for one page through its own CDP session."""
+        # Claim the page first: a new tab can reach here from both the listener and _configure_page
+        if page in self._blocking_sessions:
+            return self._blocking_sessions[page] is not None
+        self._blocking_sessions[page] = None
+        try:
+            # NOTE: Only block analytics and social media trackers - keep images for vision testing.
+            # Chrome drops matches in its own network stack: no per-request round-trip to Python,
+            # and unlike page/context.route() the HTTP cache stays enabled
+            session = await self.context.new_cdp_session(page)
+            await session.send("Network.enable")
+            await session.send("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+            self._blocking_sessions[page] = session
+            return True
         except Exception as e:
             print(f"    ⚠️ Could not enable resource filtering: {e}")
+            return False
     
     async def _clear_resource_filtering(self) -> None:
         """Clear resource filtering to allow all resources.""" 
-        try:
-            await self.page.unroute("**/*.{png,jpg,jpeg,gif,webp,svg}")
-            await self.page.unroute("**/*.{woff,woff2,ttf,eot}")
-            await self.page.unroute("**/analytics*")
-            await self.page.unroute("**/google-analytics*")
-            await self.page.unroute("**/gtag*")
-            await self.page.unroute("**/facebook*")
-            await self.page.unroute("**/twitter*")
-            print(f"    ✅ Resource filtering cleared (all resources allowed)")
-        except Exception as e:
-            print(f"    ⚠️ Could not clear resource filtering: {e}")
+        if self._filtered_context is not None:
+            self._filtered_context.remove_listener("page", self._on_context_page)
+            self._filtered_context = None
+        
+        sessions = [session for session in self._blocking_sessions.values() if session]
+        self._blocking_sessions = {}
+        if not sessions:
+            return
+        # Closed popups take their sessions with them; clearing those fails harmlessly
+        await asyncio.gather(*(
+            session.send("Network.setBlockedURLs", {"urls": []}) for session in sessions
+        ), return_exceptions=True)
+        print(f"    ✅ Resource filtering cleared (all resources allowed)")
     
     async def _type_text(self, text: str) -> bool:
         """Type text at current focus with enhanced visual feedback and credential substitution."""
@@ -1992,13 +2745,14 @@ Examples:
             
             # 🎯 VISUAL FEEDBACK: Show typing action
             print(f"    ⌨️ Typing text: '{resolved_text}'")
-            await self._capture_action_screenshot("typing")
+            self._schedule_action_screenshot("typing")
             
             # Type with slight delay for visual feedback
             await self.page.keyboard.type(resolved_text, delay=50)
             
-            # Brief pause to see the typed text
-            await asyncio.sleep(0.5)
+            # Brief pause to see the typed text (only when someone is watching)
+            if self.visual_pause_seconds:
+                await asyncio.sleep(0.5)
             print(f"    ✅ Text typed successfully")
             return True
         except Exception as e:
@@ -2007,28 +2761,20 @@ Examples:
     
     def _resolve_credentials(self, text: str) -> str:
         """Resolve credential references in text like {cred:aihub.email}."""
-        import re
-        from ..utils.credentials_loader import CredentialsLoader
-        
-        # Pattern to match credential references
-        pattern = r'\{(?:cred|credential|creds):([^}]+)\}'
+        if '{' not in text:
+            return text
         
         def replace_credential(match):
             credential_path = match.group(1).strip()
             try:
-                # Load credentials and resolve path
-                loader = CredentialsLoader()
-                credentials = loader.load_credentials()
-                
-                # Parse credential path (e.g., "aihub.email" -> aihub section, email key)
-                path_parts = credential_path.split('.')
-                if len(path_parts) != 2:
+                # Credential paths are "service.key" (e.g., "aihub.email")
+                if credential_path.count('.') != 1:
                     print(f"    ⚠️ Invalid credential path format: {credential_path}")
                     return match.group(0)
                 
-                service, key = path_parts
-                service_creds = credentials.get(service, {})
-                value = service_creds.get(key)
+                if self._credential_values is None:
+                    self._credential_values = self._load_credential_values()
+                value = self._credential_values.get(credential_path)
                 
                 if value is not None:
                     print(f"    🔑 Resolved credential: {credential_path} -> {value}")
@@ -2041,9 +2787,19 @@ Examples:
                 print(f"    ❌ Error resolving credential {credential_path}: {e}")
                 return match.group(0)
         
-        resolved_text = re.sub(pattern, replace_credential, text)
+        resolved_text = CREDENTIAL_REFERENCE_PATTERN.sub(replace_credential, text)
         return resolved_text
     
+    def _load_credential_values(self) -> Dict[str, Any]:
+        """Load credentials once, flattened to "service.key" -> value."""
+        credentials = CredentialsLoader().load_credentials()
+        return {
+            f"{service}.{key}": value
+            for service, service_creds in credentials.items()
+            if isinstance(service_creds, dict)
+            for key, value in service_creds.items()
+        }
+    
     async def _fallback_to_traditional(self, action_plan: Dict[str, Any], step_number: int) -> bool:
         """Fallback to traditional element finding if vision fails."""
         
@@ -2091,8 +2847,7 @@ Examples:
     async def _save_debug_screenshot(self, step_number: int) -> str:
         """Save debug screenshot when detection fails."""
         
-        Path("test_results").mkdir(exist_ok=True)
-        screenshot_path = f"test_results/debug_vision_step_{step_number}.png"
+        screenshot_path = f"{self.results_dir}/debug_vision_step_{step_number}.png"
         
         try:
             await self.page.screenshot(path=screenshot_path, full_page=True)
@@ -2109,23 +2864,35 @@ Examples:
     async def _generate_report(self, results: List[Dict], instruction_file: str, total_test_time: float = 0.0) -> Dict[str, Any]:
         """Generate comprehensive test report with vision and performance statistics."""
         
-        successful_steps = len([r for r in results if r["status"] == "success"])
+        # Every action screenshot must be on disk (and in the GIF queue) before reporting
+        await self._flush_action_screenshots()
+        
+        # Success count and performance statistics in a single pass over the results
+        successful_steps = 0
+        total_step_time = total_parse_time = total_execute_time = 0.0
+        max_step_time = 0.0
+        min_step_time = float("inf")
+        for r in results:
+            if r["status"] == "success":
+                successful_steps += 1
+            timing = r.get("timing", {})
+            step_time = timing.get("total_time", 0.0)
+            total_step_time += step_time
+            max_step_time = max(max_step_time, step_time)
+            min_step_time = min(min_step_time, step_time)
+            total_parse_time += timing.get("parse_time", 0.0)
+            total_execute_time += timing.get("execute_time", 0.0)
+        
         total_steps = len(results)
         success_rate = (successful_steps / total_steps * 100) if total_steps > 0 else 0
-        
-        # Calculate performance statistics
-        step_times = [r.get("timing", {}).get("total_time", 0.0) for r in results]
-        avg_step_time = sum(step_times) / len(step_times) if step_times else 0.0
-        max_step_time = max(step_times) if step_times else 0.0
-        min_step_time = min(step_times) if step_times else 0.0
-        
-        parse_times = [r.get("timing", {}).get("parse_time", 0.0) for r in results]
-        execute_times = [r.get("timing", {}).get("execute_time", 0.0) for r in results]
-        avg_parse_time = sum(parse_times) / len(parse_times) if parse_times else 0.0
-        avg_execute_time = sum(execute_times) / len(execute_times) if execute_times else 0.0
+        avg_step_time = total_step_time / total_steps if total_steps else 0.0
+        avg_parse_time = total_parse_time / total_steps if total_steps else 0.0
+        avg_execute_time = total_execute_time / total_steps if total_steps else 0.0
+        if not total_steps:
+            min_step_time = 0.0
         
         final_url = self.page.url
-        final_title = await self.page.title()
+        final_title = await self._page_title()
         
         # Vision statistics
         vision_success_rate = 0.0
@@ -2161,9 +2928,9 @@ Examples:
         print(f"  • ✅ Real-time page state monitoring")
         
         # Check if action screenshots were created
-        action_screenshots_dir = Path("test_results/actions")
+        action_screenshots_dir = self.actions_dir
         if action_screenshots_dir.exists():
-            screenshot_count = len(list(action_screenshots_dir.glob("*.png")))
+            screenshot_count = sum(1 for path in action_screenshots_dir.iterdir() if path.suffix in (".jpg", ".png"))
             print(f"  • 📸 {screenshot_count} action screenshots saved")
         
         # Save final screenshot
@@ -2202,10 +2969,8 @@ Examples:
     async def _save_final_screenshot(self, instruction_file: str) -> str:
         """Save final test screenshot and create GIF from all accumulated screenshots."""
         
-        Path("reports").mkdir(exist_ok=True)
-        Path("test_results").mkdir(exist_ok=True)
         clean_filename = instruction_file.replace('/', '_').replace('.txt', '')
-        screenshot_path = f"test_results/final_vision_{clean_filename}.png"
+        screenshot_path = f"{self.results_dir}/final_vision_{clean_filename}.png"
         
         try:
             await self.page.screenshot(path=screenshot_path, full_page=True)
@@ -2218,8 +2983,10 @@ Examples:
             if self.gif_creator.get_screenshot_count() > 1:
                 # Use run_name as custom filename if provided, otherwise use title-based naming
                 custom_filename = f"{self.run_name}.gif" if self.run_name else None
-                gif_path = self.gif_creator.create_gif(
-                    "reports", 
+                # Decoding and quantizing every frame is CPU-bound, so keep it off the event loop
+                gif_path = await asyncio.to_thread(
+                    self.gif_creator.create_gif,
+                    "reports",
                     title=f"vision_test_{clean_filename}",
                     custom_filename=custom_filename
                 )
@@ -2241,7 +3008,7 @@ Examples:
             raise FileNotFoundError(f"Instruction file not found: {instruction_file}")
         
         with open(instruction_path, 'r') as f:
-            instructions = [line.strip() for line in f.readlines() if line.strip()]
+            instructions = [line.strip() for line in f if line.strip()]
         
         return instructions
     
@@ -2255,14 +3022,26 @@ Examples:
         print("\n🛑 Cleaning up Vision-Enhanced Chrome Engine...")
         
         try:
-            # Cleanup vision components
-            await self.element_detector.cleanup()
+            await self._flush_action_screenshots()
             
-            # Cleanup browser resources
+            # Vision components and the test page are independent, so tear them down together
+            self._save_normalization_cache()
+            self._save_similar_shot_cache()
+            self._save_learned_selectors()
+            teardown = [self.element_detector.cleanup()]
+            if self.page:
+                teardown.append(self.page.close())
+            for error in await asyncio.gather(*teardown, return_exceptions=True):
+                if isinstance(error, Exception):
+                    print(f"⚠️ Cleanup warning: {error}")
             if self.page:
-                await self.page.close()
                 print("📄 Closed test page")
             
+            if self.reuse_browser and self.context is type(self)._shared_context:
+                print("♻️ Keeping shared browser alive for the next test")
+                print("✅ Vision-Enhanced Chrome Engine cleanup completed")
+                return
+            
             # Only close context and browser if we created them (not connected to existing)
             if hasattr(self, '_connected_to_existing') and self._connected_to_existing:
                 print("🔗 Connected to existing browser - keeping browser instance alive")
@@ -2273,6 +3052,8 @@ Examples:
             else:
                 print("🚀 Launched new browser - closing all resources")
                 if self.context:
+                    if self.enable_caching:
+                        await self._save_storage_state()
                     await self.context.close()
                 if self.browser:
                     await self.browser.close()
@@ -2285,6 +3066,15 @@ Examples:
         except Exception as e:
             print(f"⚠️ Cleanup warning: {e}")
     
+    async def _save_storage_state(self) -> None:
+        """Snapshot cookies and localStorage for runs that find the persistent profile locked."""
+        tmp_file = self.storage_state_file.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            await self.context.storage_state(path=str(tmp_file))
+            os.replace(tmp_file, self.storage_state_file)
+        except Exception as e:
+            print(f"⚠️ Could not save storage state: {e}")
+    
     def configure_gif_settings(self, duration: int = None, loop: int = None, optimize: bool = None) -> None:
         """
         Configure GIF creation settings.
@@ -9,6 +9,21 @@ from typing import Dict, Any, Optional
 from playwright.async_api import Page, Locator
 from pathlib import Path
 
+# Attributes collected by _analyze_element; enumerated in the browser so only
+# attributes actually present on the element cross the CDP boundary
+ANALYZED_ATTRIBUTES = ["id", "class", "role", "name", "type", "data-testid", "aria-label", "title"]
+
+ANALYZE_ELEMENT_JS = """
+(el, whitelist) => {
+    const wanted = new Set(whitelist);
+    const attributes = {};
+    for (const attr of el.attributes) {
+        if (wanted.has(attr.name)) attributes[attr.name] = attr.value;
+    }
+    return {tag: el.tagName.toLowerCase(), attributes};
+}
+"""
+
 
 class ActionExecutor:
     """Generic executor for all browser actions."""
@@ -401,10 +416,12 @@ class ActionExecutor:
     async def _analyze_element(self, element: Locator) -> Dict[str, bool]:
         """Analyze element to determine best click strategy."""
         try:
-            # Get element attributes to detect patterns
-            test_id = await element.get_attribute("data-testid") or ""
-            class_name = await element.get_attribute("class") or ""
-            tag_name = await element.evaluate("el => el.tagName.toLowerCase()")
+            # Get element attributes to detect patterns (single round-trip)
+            element_info = await element.evaluate(ANALYZE_ELEMENT_JS, ANALYZED_ATTRIBUTES)
+            attributes = element_info["attributes"]
+            test_id = attributes.get("data-testid", "")
+            class_name = attributes.get("class", "")
+            tag_name = element_info["tag"]
             
             analysis = {
                 "is_send_button": "send" in test_id.lower() and tag_name == "svg",
@@ -4,25 +4,62 @@ Generic Instruction Parser - Converts natural language to structured actions
 Works with any application by using pattern matching and NLP techniques
 """
 
+import copy
 import re
 import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional, List
+from cachetools import LRUCache
+
+
+# Explicit Playwright selector in an instruction, either quoted ("Click 'css=div.card > button'")
+# or running to the end of the clause ("Type 'x' in xpath=//input[@name='q'] and press enter")
+EXPLICIT_SELECTOR_PATTERN = re.compile(
+    r'''(["'])((?:css|xpath)=.+?)\1|\b((?:css|xpath)=.+?)(?=\s+(?:and|then)\s|[;\n]|$)'''
+)
 
 
 class InstructionParser:
     """Generic instruction parser using configurable patterns."""
     
-    def __init__(self, config_dir: Path):
+    def __init__(self, config_dir: Path, cache_size: int = 512):
         self.config_dir = config_dir
         self.action_patterns = self._load_action_patterns()
         self.context_hints = self._load_context_hints()
+        
+        # Parsing is deterministic for a given instruction, so memoize action plans
+        self._parse_cache = LRUCache(maxsize=cache_size)
     
     async def parse(self, instruction: str) -> Dict[str, Any]:
         """Parse natural language instruction into structured action plan."""
         
         instruction = instruction.strip()
         
+        # Callers annotate the returned plan, so hand out copies of cached plans
+        cached = self._parse_cache.get(instruction)
+        if cached is None:
+            cached = self._parse_uncached(instruction)
+            self._parse_cache[instruction] = cached
+        return copy.deepcopy(cached)
+    
+    async def parse_batch(self, instructions: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Parse all instructions of a test up front, in order.
+        
+        Returns one action plan per instruction, or None where parsing raised,
+        so callers can re-parse that step and handle the error in context.
+        """
+        plans = []
+        for instruction in instructions:
+            try:
+                plans.append(await self.parse(instruction))
+            except Exception:
+                plans.append(None)
+        return plans
+    
+    def _parse_uncached(self, instruction: str) -> Dict[str, Any]:
+        """Match a stripped instruction against the configured action patterns."""
+        
         # Skip comment lines and section headers
         if instruction.startswith('#') or instruction.startswith('//') or not instruction:
             return {
@@ -84,6 +121,12 @@ class InstructionParser:
         elif action_type == "wait":
             plan.update(self._extract_wait_params(instruction, match, extractor))
         
+        # Deterministic selectors let the engine skip element detection entirely
+        if action_type in ("click", "type"):
+            selector_match = EXPLICIT_SELECTOR_PATTERN.search(instruction)
+            if selector_match:
+                plan["selector"] = selector_match.group(2) or selector_match.group(3).rstrip(",.")
+        
         return plan
     
     def _extract_navigation_params(self, instruction: str, match: re.Match, extractor: Dict) -> Dict[str, Any]:
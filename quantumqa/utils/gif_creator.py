@@ -46,7 +46,12 @@ class GifCreator:
         # If we already have a screenshot for this step, remove the old one
         if step_number in self._step_screenshots:
             old_screenshot = self._step_screenshots[step_number]
-            if old_screenshot in self.accumulated_screenshots:
+            # The replaced screenshot is almost always the most recent one, so
+            # pop it in O(1) and only fall back to a linear remove otherwise
+            if self.accumulated_screenshots and self.accumulated_screenshots[-1] == old_screenshot:
+                self.accumulated_screenshots.pop()
+                print(f"    🔄 Replaced step {step_number} screenshot in GIF queue")
+            elif old_screenshot in self.accumulated_screenshots:
                 self.accumulated_screenshots.remove(old_screenshot)
                 print(f"    🔄 Replaced step {step_number} screenshot in GIF queue")
         
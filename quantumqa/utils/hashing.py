@@ -0,0 +1,60 @@
+"""
+Content hashing helpers for cache keys.
+Uses blake2b so keys are stable across processes (unlike the builtin hash()).
+Screenshots can also be fingerprinted perceptually, so near-identical pages match.
+"""
+
+import hashlib
+import io
+from pathlib import Path
+from typing import Union
+
+from PIL import Image
+
+
+DIGEST_SIZE = 16
+
+
+def text_digest(text: str) -> str:
+    """Return a stable hex digest for a string."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=DIGEST_SIZE).hexdigest()
+
+
+def bytes_digest(data: bytes) -> str:
+    """Return a stable hex digest for raw bytes (e.g. an in-memory screenshot)."""
+    return hashlib.blake2b(data, digest_size=DIGEST_SIZE).hexdigest()
+
+
+def _new_blake2b():
+    return hashlib.blake2b(digest_size=DIGEST_SIZE)
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """Return a stable hex digest of a file's contents."""
+    with open(path, "rb") as f:
+        # Python 3.11+ hashes straight from the file buffer without Python-level copies
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, _new_blake2b).hexdigest()
+        
+        digest = _new_blake2b()
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def image_ahash(image: Union[str, Path, bytes], hash_size: int = 8) -> int:
+    """Return a 64-bit average hash of an image file or encoded image bytes (one bit per cell brighter than the mean)."""
+    with Image.open(io.BytesIO(image) if isinstance(image, bytes) else image) as img:
+        # JPEGs decode straight to a 1/8-scale grayscale image; other formats ignore this
+        img.draft("L", (hash_size, hash_size))
+        pixels = img.convert("L").resize((hash_size, hash_size), Image.Resampling.BOX).tobytes()
+    mean = sum(pixels) / len(pixels)
+    bits = 0
+    for pixel in pixels:
+        bits = (bits << 1) | (pixel > mean)
+    return bits
+
+
+def hamming_distance(a: int, b: int) -> int:
+    """Number of differing bits between two perceptual hashes."""
+    return bin(a ^ b).count("1")
@@ -0,0 +1,120 @@
+"""
+Tests for the element detector's persistent detection cache.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from quantumqa.agents.element_detector import ElementDetectorAgent
+from quantumqa.core.models import BoundingBox, Coordinates, ElementDetectionResult
+
+
+class FakeVisionClient:
+    """Vision client that returns a fixed result and counts calls."""
+
+    def __init__(self, confidence: float = 0.9):
+        self.calls = 0
+        self.confidence = confidence
+
+    async def analyze_screenshot(self, screenshot_path, instruction, context=None, screenshot_bytes=None):
+        self.calls += 1
+        return ElementDetectionResult(
+            found=True,
+            confidence=self.confidence,
+            instruction=instruction,
+            center_coordinates=Coordinates(x=120, y=48),
+            bounding_box=BoundingBox(x=100, y=40, width=40, height=16),
+            element_type="button"
+        )
+
+
+@pytest.fixture
+def screenshot(tmp_path):
+    path = tmp_path / "shot.jpg"
+    path.write_bytes(b"not really a jpeg, only hashed")
+    return path
+
+
+def make_detector(cache_file, vision_client=None, **kwargs) -> ElementDetectorAgent:
+    detector = ElementDetectorAgent(vision_client=vision_client or FakeVisionClient(), cache_file=cache_file, **kwargs)
+    assert asyncio.run(detector.initialize())
+    return detector
+
+
+def detect(detector: ElementDetectorAgent, screenshot, **kwargs) -> ElementDetectionResult:
+    return asyncio.run(detector.detect_element(str(screenshot), "click login", {"url": "https://example.com"}, **kwargs))
+
+
+def test_round_trip_across_runs(tmp_path, screenshot):
+    cache_file = tmp_path / "cache" / "detections.json"
+    first = make_detector(cache_file)
+    original = detect(first, screenshot)
+    asyncio.run(first.cleanup())
+
+    assert cache_file.exists()
+
+    client = FakeVisionClient()
+    second = make_detector(cache_file, client)
+    cached = detect(second, screenshot)
+
+    assert client.calls == 0
+    assert second.cache_hits == 1
+    assert cached == original
+    assert isinstance(cached.center_coordinates, Coordinates)
+    assert (cached.center_coordinates.x, cached.center_coordinates.y) == (120, 48)
+    assert isinstance(cached.bounding_box, BoundingBox)
+
+
+def test_low_confidence_not_persisted(tmp_path, screenshot):
+    cache_file = tmp_path / "detections.json"
+    detector = make_detector(cache_file, FakeVisionClient(confidence=0.5))
+    detect(detector, screenshot)
+    asyncio.run(detector.cleanup())
+
+    assert not cache_file.exists()
+
+
+def test_expired_entries_dropped(tmp_path, screenshot):
+    cache_file = tmp_path / "detections.json"
+    detector = make_detector(cache_file)
+    detect(detector, screenshot)
+    asyncio.run(detector.cleanup())
+
+    entries = json.loads(cache_file.read_text())
+    for entry in entries.values():
+        entry["saved_at"] = time.time() - 3600
+    cache_file.write_text(json.dumps(entries))
+
+    client = FakeVisionClient()
+    expired = make_detector(cache_file, client, persistent_cache_ttl=60)
+    detect(expired, screenshot)
+
+    assert client.calls == 1
+
+    # The reloaded cache dropped the stale entry and stored the fresh detection
+    asyncio.run(expired.cleanup())
+    saved = json.loads(cache_file.read_text())
+    assert len(saved) == 1
+    assert all(entry["saved_at"] > time.time() - 60 for entry in saved.values())
+
+
+def test_in_memory_screenshot_shares_key(tmp_path, screenshot):
+    client = FakeVisionClient()
+    detector = make_detector(tmp_path / "detections.json", client)
+    detect(detector, screenshot)
+    detect(detector, "/nonexistent.jpg", screenshot_bytes=screenshot.read_bytes())
+
+    assert client.calls == 1
+    assert detector.cache_hits == 1
+
+
+def test_missing_screenshot(tmp_path):
+    client = FakeVisionClient()
+    detector = make_detector(tmp_path / "detections.json", client)
+    result = detect(detector, tmp_path / "missing.jpg")
+
+    assert not result.found
+    assert client.calls == 0
@@ -0,0 +1,77 @@
+"""
+Tests for content and perceptual hashing helpers.
+"""
+
+import io
+
+from PIL import Image, ImageDraw
+
+from quantumqa.utils.hashing import bytes_digest, file_digest, hamming_distance, image_ahash, text_digest
+
+
+def jpeg_bytes(image: Image.Image) -> bytes:
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def page_image(button_x: int = 40, size=(320, 240)) -> Image.Image:
+    image = Image.new("RGB", size, "white")
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((0, 0, size[0], 30), fill="navy")
+    draw.rectangle((button_x, 100, button_x + 120, 140), fill="black")
+    return image
+
+
+def test_text_digest_stable():
+    assert text_digest("click login") == text_digest("click login")
+    assert text_digest("click login") != text_digest("click logout")
+    assert len(text_digest("")) == 32
+
+
+def test_file_and_bytes_digest_agree(tmp_path):
+    data = jpeg_bytes(page_image())
+    path = tmp_path / "shot.jpg"
+    path.write_bytes(data)
+
+    assert file_digest(path) == bytes_digest(data)
+    assert file_digest(str(path)) == bytes_digest(data)
+
+
+def test_file_digest_large_file(tmp_path):
+    data = bytes(range(256)) * 1024
+    path = tmp_path / "big.bin"
+    path.write_bytes(data)
+
+    assert file_digest(path) == bytes_digest(data)
+
+
+def test_image_ahash_path_and_bytes_agree(tmp_path):
+    data = jpeg_bytes(page_image())
+    path = tmp_path / "shot.jpg"
+    path.write_bytes(data)
+
+    assert image_ahash(path) == image_ahash(data)
+
+
+def test_image_ahash_near_and_far():
+    base = image_ahash(jpeg_bytes(page_image()))
+    recompressed = image_ahash(jpeg_bytes(page_image().resize((640, 480))))
+    different = image_ahash(jpeg_bytes(page_image(button_x=180)))
+
+    assert 0 <= base < 1 << 64
+    assert hamming_distance(base, recompressed) <= 2
+    assert hamming_distance(base, different) > hamming_distance(base, recompressed)
+
+
+def test_image_ahash_png():
+    buffer = io.BytesIO()
+    page_image().save(buffer, format="PNG")
+
+    assert hamming_distance(image_ahash(buffer.getvalue()), image_ahash(jpeg_bytes(page_image()))) <= 2
+
+
+def test_hamming_distance():
+    assert hamming_distance(0, 0) == 0
+    assert hamming_distance(0b1011, 0b0010) == 2
+    assert hamming_distance(0, (1 << 64) - 1) == 64
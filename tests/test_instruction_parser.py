@@ -0,0 +1,74 @@
+"""
+Tests for instruction parsing: explicit selectors and action plan building.
+"""
+
+import asyncio
+
+import pytest
+
+from quantumqa.parsers.instruction_parser import InstructionParser
+
+
+@pytest.fixture
+def parser(tmp_path):
+    return InstructionParser(tmp_path)
+
+
+def parse(parser: InstructionParser, instruction: str):
+    return asyncio.run(parser.parse(instruction))
+
+
+@pytest.mark.parametrize("instruction, selector", [
+    ("Click css=#login", "css=#login"),
+    ("Click css=#login.", "css=#login"),
+    ("Click css=div.card > button", "css=div.card > button"),
+    ("Click xpath=//a[text()='Sign in']", "xpath=//a[text()='Sign in']"),
+    ("Click 'css=div.card > button' in the sidebar", "css=div.card > button"),
+    ('Click "xpath=//a[text()=\'Sign in\']" twice', "xpath=//a[text()='Sign in']"),
+    ("Click css=#Submit-Button, then wait", "css=#Submit-Button"),
+    ("Type 'hello' in css=input[name='q'] and press enter", "css=input[name='q']"),
+])
+def test_explicit_selector(parser, instruction, selector):
+    plan = parse(parser, instruction)
+
+    assert plan["action"] in ("click", "type")
+    assert plan["selector"] == selector
+
+
+@pytest.mark.parametrize("instruction", [
+    "Click the login button",
+    "Type 'hello' in the search field",
+])
+def test_no_selector_for_plain_targets(parser, instruction):
+    assert "selector" not in parse(parser, instruction)
+
+
+@pytest.mark.parametrize("instruction", [
+    "Verify css=#banner is visible",
+    "Wait for css=#spinner to disappear",
+])
+def test_selector_only_for_click_and_type(parser, instruction):
+    assert "selector" not in parse(parser, instruction)
+
+
+def test_parse_returns_independent_copies(parser):
+    first = parse(parser, "Click css=#login")
+    first["selector"] = "changed"
+
+    assert parse(parser, "Click css=#login")["selector"] == "css=#login"
+
+
+def test_parse_batch_isolates_failures(parser, monkeypatch):
+    original = parser._parse_uncached
+
+    def flaky(instruction):
+        if instruction == "boom":
+            raise RuntimeError("parse failed")
+        return original(instruction)
+
+    monkeypatch.setattr(parser, "_parse_uncached", flaky)
+    plans = asyncio.run(parser.parse_batch(["Click css=#a", "boom", "# comment"]))
+
+    assert plans[0]["selector"] == "css=#a"
+    assert plans[1] is None
+    assert plans[2]["action"] == "comment"
@@ -0,0 +1,53 @@
+"""
+Tests for the tracker URL patterns blocked in performance mode.
+"""
+
+import re
+
+import pytest
+
+from quantumqa.engines.vision_chrome_engine import BLOCKED_URL_PATTERNS
+
+
+def blocked(url: str) -> bool:
+    """Match a URL the way Network.setBlockedURLs does: '*' is the only wildcard, over the whole URL."""
+    return any(
+        re.fullmatch(".*".join(map(re.escape, pattern.split("*"))), url)
+        for pattern in BLOCKED_URL_PATTERNS
+    )
+
+
+@pytest.mark.parametrize("url", [
+    "https://www.google-analytics.com/analytics.js",
+    "https://www.google-analytics.com/g/collect?v=2",
+    "https://www.googletagmanager.com/gtag/js?id=G-123",
+    "https://stats.g.doubleclick.net/r/collect",
+    "https://pagead2.googlesyndication.com/pagead/js/adsbygoogle.js",
+    "https://connect.facebook.net/en_US/fbevents.js",
+    "https://platform.twitter.com/widgets.js",
+    "https://api.segment.io/v1/t",
+    "https://cdn.segment.com/analytics.js/v1/key/analytics.min.js",
+    "https://static.hotjar.com/c/hotjar-123.js?sv=6",
+    "https://vc.hotjar.io/sessions",
+    "https://example.com/static/analytics.js",
+    "https://example.com/assets/gtag.js",
+])
+def test_trackers_blocked(url):
+    assert blocked(url)
+
+
+@pytest.mark.parametrize("url", [
+    "https://app.example.com/analytics/overview",
+    "https://app.example.com/api/analytics/events",
+    "https://app.example.com/analytics",
+    "https://example.com/reports/google-analytics-import",
+    "https://twitter.com/home",
+    "https://x.com/twitter",
+    "https://facebook.com/login",
+    "https://www.facebook.com/",
+    "https://www.hotjar.com/",
+    "https://segment.com/docs/",
+    "https://example.com/",
+])
+def test_first_party_pages_not_blocked(url):
+    assert not blocked(url)
@@ -0,0 +1,109 @@
+"""
+Tests for concurrent selector probing: rank order, early return and cancellation.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from quantumqa.engines.vision_chrome_engine import VisionChromeEngine
+
+BOX = {"x": 10, "y": 20, "width": 100, "height": 40}
+
+
+class FakeProbes:
+    """Replaces _probe_selector: each selector answers after a delay, with a box or None."""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.started = []
+        self.cancelled = []
+
+    async def __call__(self, selector_info):
+        selector = selector_info["selector"]
+        self.started.append(selector)
+        delay, box = self.answers.get(selector, (0, None))
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled.append(selector)
+            raise
+        return box
+
+
+@pytest.fixture
+def engine():
+    engine = object.__new__(VisionChromeEngine)
+    engine.debug = False
+    return engine
+
+
+def wave_of(*selectors):
+    return [("target", {"selector": selector, "strategy": "test", "priority": rank}) for rank, selector in enumerate(selectors)]
+
+
+def run_wave(engine, probes, wave):
+    engine._probe_selector = probes
+
+    async def run():
+        result = await engine._probe_selector_wave(wave)
+        # Let cancelled probes observe their cancellation
+        await asyncio.sleep(0)
+        return result
+
+    return asyncio.run(run())
+
+
+def test_best_ranked_hit_wins_over_faster_lower_rank(engine):
+    probes = FakeProbes({
+        "a": (0.05, None),
+        "b": (0.03, dict(BOX, x=200)),
+        "c": (0.0, BOX),
+    })
+    coords = run_wave(engine, probes, wave_of("a", "b", "c"))
+
+    assert (coords.x, coords.y) == (250, 40)
+
+
+def test_returns_without_waiting_for_lower_ranks_and_cancels_them(engine):
+    probes = FakeProbes({
+        "a": (0.0, BOX),
+        "b": (5.0, BOX),
+        "c": (5.0, None),
+    })
+    started_at = time.monotonic()
+    coords = run_wave(engine, probes, wave_of("a", "b", "c"))
+
+    assert (coords.x, coords.y) == (60, 40)
+    assert probes.started == ["a", "b", "c"]
+    assert sorted(probes.cancelled) == ["b", "c"]
+    assert time.monotonic() - started_at < 1.0
+
+
+def test_all_misses(engine):
+    probes = FakeProbes({"a": (0.01, None), "b": (0.0, None)})
+
+    assert run_wave(engine, probes, wave_of("a", "b")) is None
+    assert probes.cancelled == []
+
+
+def test_traditional_detection_stops_after_hit_wave(engine):
+    engine._validate_coordinates_in_viewport = lambda coords: True
+    ordered = sorted(
+        engine._generate_smart_selectors("Search", {"action": "click"}),
+        key=lambda info: info["priority"]
+    )
+    wave_size = VisionChromeEngine._CONCURRENT_SELECTOR_PROBES
+    assert len(ordered) > 2 * wave_size
+
+    hit = ordered[wave_size + 2]["selector"]
+    probes = FakeProbes({hit: (0.0, BOX)})
+    engine._probe_selector = probes
+    coords = asyncio.run(engine._try_enhanced_traditional_detection(
+        {"action": "click"}, "Search", ["Search"]
+    ))
+
+    assert (coords.x, coords.y) == (60, 40)
+    # First wave missed, second wave hit, third wave never started
+    assert probes.started == [info["selector"] for info in ordered[:2 * wave_size]]
@@ -0,0 +1,63 @@
+"""
+Tests for smart selector generation and the keyword gating of optional template groups.
+"""
+
+import pytest
+
+from quantumqa.engines.vision_chrome_engine import VisionChromeEngine
+
+
+@pytest.fixture
+def engine():
+    # Selector generation only needs the class templates and the debug flag
+    engine = object.__new__(VisionChromeEngine)
+    engine.debug = False
+    return engine
+
+
+def strategies(engine, target, **plan):
+    return {selector["strategy"] for selector in engine._generate_smart_selectors(target, {"action": "click", **plan})}
+
+
+@pytest.mark.parametrize("target", [
+    "search", "Search field", "textarea", "searchbar", "searchbox", "textbox",
+    "message input", "Query your files", "upload files",
+])
+def test_input_templates_enabled(engine, target):
+    assert "input_placeholder" in strategies(engine, target)
+
+
+@pytest.mark.parametrize("target", ["Submit", "Save changes", "Settings", "file"])
+def test_input_templates_not_enabled(engine, target):
+    assert "input_placeholder" not in strategies(engine, target)
+
+
+@pytest.mark.parametrize("target", ["Create", "create dropdown", "Createbutton", "Dropdowns"])
+def test_dropdown_button_templates(engine, target):
+    assert "dropdown_button_aria" in strategies(engine, target)
+
+
+@pytest.mark.parametrize("target, enabled", [
+    ("Workspaces", True),
+    ("Sign in", True),
+    ("loginbutton", True),
+    ("Signin", False),
+    ("Submit", False),
+])
+def test_link_templates(engine, target, enabled):
+    assert ("link_text" in strategies(engine, target)) == enabled
+
+
+def test_selectors_in_priority_order(engine):
+    selectors = engine._generate_smart_selectors("Search", {"action": "click"})
+    priorities = [selector["priority"] for selector in selectors]
+
+    assert priorities == sorted(priorities)
+    assert priorities[0] == 0
+    assert next(s for s in selectors if s["priority"] == 1)["selector"] == "text='Search'"
+
+
+def test_ui_context_demotes_text_match(engine):
+    selectors = engine._generate_smart_selectors("Search", {"action": "click", "ui_context_type": "dropdown"})
+
+    assert next(s for s in selectors if s["strategy"] == "exact_text")["priority"] == 3
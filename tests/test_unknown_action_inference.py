@@ -0,0 +1,75 @@
+"""
+Tests for inferring the action and target of instructions the parser did not recognize.
+"""
+
+import asyncio
+
+import pytest
+
+from quantumqa.core.models import Coordinates
+from quantumqa.engines.vision_chrome_engine import LEADING_FILLER_PATTERN, VisionChromeEngine
+
+
+class RecordingEngine:
+    """Stands in for the engine's vision steps and records what they were asked for."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def _verify_element_with_vision(self, element_description, step_number):
+        self.calls.append(("verify", element_description))
+        return True
+
+    async def _find_element_with_vision(self, action_plan, step_number):
+        self.calls.append(("click", action_plan["target"]))
+        return Coordinates(x=10, y=20)
+
+    async def _click_at_coordinates(self, coordinates):
+        return True
+
+
+def infer(instruction: str):
+    engine = RecordingEngine()
+    plan = {"action": "unknown", "raw_instruction": instruction}
+    assert asyncio.run(VisionChromeEngine._execute_unknown_action_with_vision(engine, plan, 1))
+    assert len(engine.calls) == 1
+    return engine.calls[0]
+
+
+@pytest.mark.parametrize("instruction, expected", [
+    ("Look for the Submit button", ("verify", "submit button")),
+    ("Search for that the results panel", ("verify", "results panel")),
+    ("Tap on Login", ("click", "login")),
+    ("Press the Save button", ("click", "save button")),
+    ("Please select in the sidebar Reports", ("click", "sidebar reports")),
+    ("Find and click the menu", ("verify", "and click the menu")),
+])
+def test_target_follows_keyword(instruction, expected):
+    assert infer(instruction) == expected
+
+
+@pytest.mark.parametrize("instruction, expected", [
+    # Typing targets are not extracted yet: the whole instruction is verified instead
+    ("Enter your email", ("verify", "enter your email")),
+    ("Ensure the banner is shown", ("verify", "ensure the banner is shown")),
+    # No keyword at all: verify whatever the instruction describes, minus leading filler
+    ("The dashboard heading", ("verify", "dashboard heading")),
+])
+def test_whole_instruction_is_target(instruction, expected):
+    assert infer(instruction) == expected
+
+
+def test_keyword_without_target_keeps_instruction():
+    assert infer("Click") == ("click", "click")
+
+
+@pytest.mark.parametrize("text, stripped", [
+    ("that the submit button", "submit button"),
+    ("is on  the page header", "page header"),
+    ("the", "the"),
+    ("theme toggle", "theme toggle"),
+    ("at the bottom in the footer", "bottom in the footer"),
+    ("submit button", "submit button"),
+])
+def test_leading_filler_stripped(text, stripped):
+    assert LEADING_FILLER_PATTERN.sub("", text) == stripped
@@ -0,0 +1,223 @@
+"""
+Tests for the vision client: streaming early exit, image downscaling and coordinate mapping.
+"""
+
+import asyncio
+import base64
+import io
+import json
+from types import SimpleNamespace
+
+import pytest
+from PIL import Image
+
+from quantumqa.core.llm import VisionLLMClient, _estimated_image_tokens, _first_element_span
+
+
+ELEMENT = {
+    "element_type": "button",
+    "bounding_box": {"x": 10, "y": 20, "width": 100, "height": 40},
+    "center_coordinates": {"x": 60, "y": 40},
+    "confidence": 0.95
+}
+
+
+def make_client(**kwargs) -> VisionLLMClient:
+    return VisionLLMClient(api_key="sk-test", model="gpt-4o", max_retries=1, **kwargs)
+
+
+def image_base64(size=(1365, 768)) -> str:
+    buffer = io.BytesIO()
+    Image.new("RGB", size, "white").save(buffer, format="JPEG")
+    return base64.b64encode(buffer.getvalue()).decode("utf-8")
+
+
+def stream_of(text: str, chunk_size: int = 7, usage=None):
+    """Fake a chat completion stream that delivers text in small deltas, then optional usage."""
+
+    class Stream:
+        def __init__(self):
+            self.closed = False
+            self.delivered = 0
+
+        async def __aiter__(self):
+            for start in range(0, len(text), chunk_size):
+                self.delivered = start + chunk_size
+                delta = SimpleNamespace(content=text[start:start + chunk_size])
+                yield SimpleNamespace(usage=None, choices=[SimpleNamespace(delta=delta)])
+            if usage:
+                yield SimpleNamespace(usage=usage, choices=[])
+
+        async def close(self):
+            self.closed = True
+
+    return Stream()
+
+
+def call_with_stream(client: VisionLLMClient, text: str, usage=None):
+    stream = stream_of(text, usage=usage)
+
+    async def create(**kwargs):
+        return stream
+
+    client.client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    response = asyncio.run(client._call_vision_model_with_retry(image_base64(), "p" * 400, "image/jpeg"))
+    return response, stream
+
+
+class TestFirstElementSpan:
+
+    def test_complete_first_element(self):
+        text = '{"elements": [ ' + json.dumps(ELEMENT) + ', {"element_type": "li'
+        start, end = _first_element_span(text)
+        assert json.loads(text[start:end]) == ELEMENT
+
+    def test_incomplete_first_element(self):
+        assert _first_element_span('{"elements": [{"element_type": "button", "center') is None
+
+    def test_braces_inside_strings(self):
+        text = '{"elements":[{"visible_text": "a } b \\" {"}]}'
+        start, end = _first_element_span(text)
+        assert json.loads(text[start:end]) == {"visible_text": 'a } b " {'}
+
+    @pytest.mark.parametrize("text", [
+        '{"elements": [], "page_analysis": {"page_type": "login"}}',
+        '{"elements":[\n]}',
+        '{"page_analysis": {"page_type": "login"}, "elements": [], "recommendation": {"a": 1}}',
+        '{"elements": ',
+        '{"elements": [',
+    ])
+    def test_no_first_element(self, text):
+        assert _first_element_span(text) is None
+
+
+class TestStreamingEarlyExit:
+
+    def test_stops_at_first_complete_element(self):
+        client = make_client()
+        text = json.dumps({
+            "page_analysis": {"page_type": "login"},
+            "elements": [ELEMENT, dict(ELEMENT, confidence=0.5)],
+            "recommendation": "click it"
+        })
+        response, stream = call_with_stream(client, text)
+
+        assert response == {"elements": [ELEMENT]}
+        assert client.early_exits == 1
+        assert stream.closed and stream.delivered < len(text)
+
+    @pytest.mark.parametrize("text", [
+        json.dumps({"elements": [], "page_analysis": {"page_type": "login", "confidence": 0.9}}),
+        json.dumps({"page_analysis": {"page_type": "login"}, "elements": [], "recommendation": {"note": "none"}}),
+    ])
+    def test_empty_elements_read_to_end(self, text):
+        client = make_client()
+        response, _ = call_with_stream(client, text)
+
+        assert response == json.loads(text)
+        assert client.early_exits == 0
+
+        result = asyncio.run(client._parse_vision_response(response, "click login"))
+        assert not result.found
+        assert result.center_coordinates is None
+
+    def test_element_without_center_read_to_end(self):
+        client = make_client()
+        text = json.dumps({"elements": [{"element_type": "button", "confidence": 0.9}, ELEMENT]})
+        response, _ = call_with_stream(client, text)
+
+        assert response == json.loads(text)
+        assert client.early_exits == 0
+
+    def test_early_exit_disabled(self):
+        client = make_client(early_exit=False)
+        text = json.dumps({"elements": [ELEMENT], "page_analysis": {}})
+        response, _ = call_with_stream(client, text)
+
+        assert response == json.loads(text)
+        assert client.early_exits == 0
+
+
+class TestCostEstimate:
+
+    @pytest.mark.parametrize("size, tokens", [
+        ((1365, 768), 85 + 170 * 6),
+        ((512, 512), 85 + 170),
+        ((4000, 1000), 85 + 170 * 4),
+        ((3000, 3000), 85 + 170 * 4),
+    ])
+    def test_image_tokens(self, size, tokens):
+        assert _estimated_image_tokens(image_base64(size)) == tokens
+
+    def test_unreadable_image_counts_base_tokens(self):
+        assert _estimated_image_tokens("bm90IGFuIGltYWdl") == 85
+
+    def test_early_exit_still_costs_input(self):
+        client = make_client()
+        text = json.dumps({"elements": [ELEMENT, ELEMENT]})
+        call_with_stream(client, text)
+
+        assert client.early_exits == 1
+        input_tokens = 85 + 170 * 6 + 100
+        assert client.estimated_cost >= input_tokens * 0.01 / 1000
+        assert client.get_usage_stats()["estimated_cost"] > 0
+
+    def test_reported_usage_used_when_stream_completes(self):
+        client = make_client(early_exit=False)
+        usage = SimpleNamespace(prompt_tokens=1200, completion_tokens=100)
+        call_with_stream(client, json.dumps({"elements": [ELEMENT]}), usage=usage)
+
+        assert client.estimated_cost == pytest.approx(1200 * 0.01 / 1000 + 100 * 0.03 / 1000)
+
+
+class TestDownscale:
+
+    @staticmethod
+    def encoded(size, fmt="PNG") -> bytes:
+        buffer = io.BytesIO()
+        Image.new("RGB", size, "white").save(buffer, format=fmt)
+        return buffer.getvalue()
+
+    @pytest.mark.parametrize("size, scale, sent_size", [
+        ((1536, 1024), 0.75, (1152, 768)),
+        ((1024, 2048), 0.75, (768, 1536)),
+        ((4000, 1000), 0.512, (2048, 512)),
+        ((800, 600), 1.0, (800, 600)),
+    ])
+    def test_prepare_image_scale(self, size, scale, sent_size):
+        client = make_client()
+        image_base64, mime_type, sent_scale = asyncio.run(client._prepare_image("unused.png", self.encoded(size)))
+
+        assert mime_type == "image/jpeg"
+        assert sent_scale == pytest.approx(scale)
+        with Image.open(io.BytesIO(base64.b64decode(image_base64))) as sent:
+            assert sent.format == "JPEG"
+            assert sent.size == sent_size
+
+    def test_small_jpeg_sent_unchanged(self, tmp_path):
+        data = self.encoded((800, 600), "JPEG")
+        path = tmp_path / "shot.jpg"
+        path.write_bytes(data)
+        client = make_client()
+
+        from_bytes = asyncio.run(client._prepare_image("unused.jpg", data))
+        from_path = asyncio.run(client._prepare_image(str(path)))
+
+        assert from_bytes == from_path == (base64.b64encode(data).decode("utf-8"), "image/jpeg", 1.0)
+
+    def test_coordinates_mapped_back_to_screenshot(self):
+        client = make_client()
+        response = {"elements": [ELEMENT]}
+        result = asyncio.run(client._parse_vision_response(response, "click login", scale=0.75))
+
+        assert result.found
+        assert (result.center_coordinates.x, result.center_coordinates.y) == (80, 53)
+        assert (result.bounding_box.x, result.bounding_box.y) == (13, 27)
+        assert (result.bounding_box.width, result.bounding_box.height) == (133, 53)
+
+    def test_unscaled_coordinates_unchanged(self):
+        client = make_client()
+        result = asyncio.run(client._parse_vision_response({"elements": [ELEMENT]}, "click login"))
+
+        assert (result.center_coordinates.x, result.center_coordinates.y) == (60, 40)
+        assert result.confidence == 0.95